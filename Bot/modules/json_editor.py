@@ -4,20 +4,128 @@ import re
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, 
                              QPushButton, QLabel, QComboBox, QTabWidget, QSplitter,
                              QMessageBox, QToolBar, QStatusBar, QMenu, QTreeWidget,
-                             QTreeWidgetItem, QLineEdit, QFileDialog, QFrame
+                             QTreeWidgetItem, QLineEdit, QFileDialog, QFrame,
+                             QApplication, QPlainTextDocumentLayout
                              )
-from PySide6.QtCore import Qt, Signal, Slot, QTimer, QSize
+from PySide6.QtCore import (Qt, Signal, Slot, QTimer, QSize, QObject, QRunnable,
+                          QThreadPool, QCoreApplication)
 from PySide6.QtGui import (QTextCharFormat, QSyntaxHighlighter, QFont, QColor, 
-                          QAction, QKeySequence, QShortcut)
+                          QAction, QKeySequence, QShortcut, QTextDocument, QTextCursor)
 
 import json
+import bisect
+import functools
+import itertools
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime
 
+# orjson används för radvis parse/format om det finns installerat
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Antal rader mellan avbrottskontrollerna när JSONL-rader formateras
+_BATCH_SIZE = 64
+
+
+def _loads(line: str) -> Any:
+    """Parsa en JSONL-rad, med orjson när det är möjligt"""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # T.ex. heltal över 64 bitar, låt json avgöra
+    return json.loads(line)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_line(line: str) -> Any:
+    """
+    Parsa en JSONL-rad med cache, delad mellan förhandsvisning, formattering
+    och validering. Returnerade objekt delas mellan anrop och får inte ändras.
+    """
+    return _loads(line)
+
+
+# Markerar tomma eller ogiltiga rader i JsonEditor._parsed
+_INVALID = object()
+
+
+def _parse_or_invalid(line: str) -> Any:
+    """Parsa en rad, eller returnera _INVALID för tomma och ogiltiga rader"""
+    if not line or line.isspace():
+        return _INVALID
+    try:
+        return _parse_line(line)
+    except json.JSONDecodeError:
+        return _INVALID
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialisera ett JSON-objekt med indrag på två steg"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def _format_preview_line(line: str) -> str:
+    """Formattera en rad för förhandsvisningen, ogiltig JSON visas som den är"""
+    try:
+        return _dumps_indented(_parse_line(line))
+    except json.JSONDecodeError:
+        return line
+
+
+def _format_compact_line(line: str) -> str:
+    """Formattera en rad till en rad med normaliserade mellanrum"""
+    return _dumps_indented(_parse_line(line)).replace('\n', '')
+
+
+def _changed_range(old: List[str], new: List[str]) -> Tuple[int, int, int]:
+    """
+    Jämför två radlistor och returnera (start, old_end, new_end) så att
+    old[start:old_end] har ersatts av new[start:new_end].
+    """
+    start, limit = 0, min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end, new_end
+
+
+def _apply_batch(func: Callable[[str], str], batch: List[str]) -> List[str]:
+    # map itererar i C, utan bytekod per rad
+    return list(map(func, batch))
+
+
+def _map_lines(func: Callable[[str], str], lines: List[str],
+               is_cancelled: Callable[[], bool] = lambda: False) -> Optional[List[str]]:
+    """
+    Applicera func på varje rad, batchvis i den anropande tråden.
+    
+    orjson släpper inte GIL, så en trådpool gör bara arbetet långsammare.
+    Returnerar None om is_cancelled() blir sant mellan två batcher.
+    Undantag från func propageras till anroparen.
+    """
+    results: List[str] = []
+    for i in range(0, len(lines), _BATCH_SIZE):
+        if is_cancelled():
+            return None
+        results.extend(_apply_batch(func, lines[i:i + _BATCH_SIZE]))
+    return results
+
+
 class JsonSyntaxHighlighter(QSyntaxHighlighter):
     """Syntaxmarkering för JSON med stöd för JSONL-format"""
     
@@ -34,18 +142,18 @@ class JsonSyntaxHighlighter(QSyntaxHighlighter):
             'error': self._create_format(QColor("#D32F2F"), background=QColor("#FFEBEE")) # Fel i rött
         }
         
-        # Regler för syntaxmarkering
+        # Regler för syntaxmarkering: (mönster, format, grupp som markeras)
         self.rules = [
             # Nycklar
-            (r'"[^"]*"\s*:', self.formats['key']),
-            # Strängar
-            (r':\s*"[^"]*"', self.formats['string']),
+            (re.compile(r'"[^"]*"\s*:'), self.formats['key'], 0),
+            # Strängar, markera bara värdet
+            (re.compile(r':\s*(?P<str>"(?:[^"\\]|\\.)*")'), self.formats['string'], 'str'),
             # Nummer
-            (r':\s*-?\d+\.?\d*', self.formats['number']),
+            (re.compile(r':\s*-?\d+\.?\d*'), self.formats['number'], 0),
             # Boolean
-            (r':\s*(true|false)', self.formats['boolean']),
+            (re.compile(r':\s*(true|false)'), self.formats['boolean'], 0),
             # Null
-            (r':\s*null', self.formats['null'])
+            (re.compile(r':\s*null'), self.formats['null'], 0)
         ]
     
     def _create_format(self, color, background=None):
@@ -58,26 +166,99 @@ class JsonSyntaxHighlighter(QSyntaxHighlighter):
     
     def highlightBlock(self, text: str):
         """Markera ett textblock med JSON-syntax"""
-        for pattern, format in self.rules:
-            for match in re.finditer(pattern, text):
-                # För strängar, markera bara värdet
-                if format == self.formats['string']:
-                    # Hitta start av strängvärdet
-                    start = match.group().find('"', match.group().find(':'))
-                    if start != -1:
-                        self.setFormat(match.start() + start, 
-                                     len(match.group()) - start, format)
-                # För andra typer, markera hela matchningen
-                else:
-                    self.setFormat(match.start(), len(match.group()), format)
+        for pattern, format, group in self.rules:
+            for match in pattern.finditer(text):
+                start = match.start(group)
+                self.setFormat(start, match.end(group) - start, format)
+
+class _PreviewSignals(QObject):
+    """Signaler från bakgrundsjobbet för förhandsvisning"""
+    finished = Signal(int, object)  # generation, (poster, {rå rad: formaterad text})
+
+class _PreviewJob(QRunnable):
+    """Förbereder JSONL-poster för förhandsvisningen i en bakgrundstråd"""
+    
+    def __init__(self, lines: List[str], window: Tuple[int, int], generation: int,
+                 current_generation):
+        super().__init__()
+        self.lines = lines
+        # Postintervall som syns i förhandsvisningen och formateras direkt
+        self.window = window
+        self.generation = generation
+        # Anropas för att avgöra om en nyare redigering har ersatt jobbet
+        self.current_generation = current_generation
+        self.signals = _PreviewSignals()
+    
+    def run(self):
+        # isspace() hittar tomma rader utan att skapa en ny sträng som strip()
+        entries = [line for line in self.lines if line and not line.isspace()]
+        visible = entries[self.window[0]:self.window[1]]
+        formatted_lines = _map_lines(
+            _format_preview_line, visible,
+            lambda: self.current_generation() != self.generation
+        )
+        if formatted_lines is None:
+            return  # Avbrutet, resultatet skulle ändå kastas
+        
+        self.signals.finished.emit(self.generation, (entries, dict(zip(visible, formatted_lines))))
+
+class _DocumentSignals(QObject):
+    """Signaler från bakgrundsjobbet som bygger editorns dokument"""
+    finished = Signal(int, object)  # generation, QTextDocument
+    failed = Signal(int, str)       # generation, felmeddelande
+
+class _DocumentLoadJob(QRunnable):
+    """Läser en fil och bygger ett QTextDocument av den i en bakgrundstråd"""
+    
+    def __init__(self, file_path: Path, generation: int):
+        super().__init__()
+        self.file_path = file_path
+        self.generation = generation
+        # Dokumentet måste tillhöra GUI-tråden innan editorn tar över det
+        self.gui_thread = QApplication.instance().thread()
+        self.signals = _DocumentSignals()
+    
+    def run(self):
+        try:
+            content = self.file_path.read_text(encoding='utf-8')
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        
+        document = QTextDocument()
+        document.setPlainText(content)
+        document.setModified(False)
+        
+        # Kör highlighterns fördröjda första markering här i stället för i GUI-tråden
+        highlighter = JsonSyntaxHighlighter(document)
+        QCoreApplication.sendPostedEvents(highlighter)
+        
+        # Highlightern följer med som barn till dokumentet
+        document.moveToThread(self.gui_thread)
+        self.signals.finished.emit(self.generation, document)
 
 class JsonlPreview(QPlainTextEdit):
-    """Widget för att visa formaterad JSONL-data"""
+    """
+    Widget för att visa formaterad JSONL-data.
+    
+    Bara poster i eller nära det synliga området formateras; övriga visas som
+    råa rader tills de skrollas fram.
+    """
+    
+    # Antal poster efter det synliga området som också formateras
+    PREFETCH = 10
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
+        self._lines = ['']  # Raderna i den text som visas just nu
+        self._entries: List[str] = []       # Råa JSONL-rader, en per post
+        self._shown: List[bool] = []        # Om posten visas formaterad
+        self._line_counts: List[int] = []   # Antal visade rader per post
+        self._formatted: Dict[str, str] = {}  # Rå rad -> formaterad text
+        self._formatting = False
         self.setup_ui()
+        self.verticalScrollBar().valueChanged.connect(self._format_visible)
     
     def setup_ui(self):
         """Konfigurera utseende"""
@@ -91,6 +272,113 @@ class JsonlPreview(QPlainTextEdit):
         # Konfigurera visning
         self.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.setTabStopDistance(40)  # 40 pixlar per tab
+        self.document().setUndoRedoEnabled(False)
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._format_visible()
+    
+    def visible_entry_range(self) -> Tuple[int, int]:
+        """Intervall (start, slut) av poster som syns, inklusive PREFETCH"""
+        first_block = self.firstVisibleBlock().blockNumber()
+        block_count = self.viewport().height() // max(1, self.fontMetrics().lineSpacing()) + 1
+        
+        # Första blocket för varje post; poster skiljs åt av en tom rad
+        starts = list(itertools.accumulate((count + 1 for count in self._line_counts), initial=0))
+        first = max(0, bisect.bisect_right(starts, first_block) - 1)
+        last = bisect.bisect_right(starts, first_block + block_count)
+        return first, min(len(self._entries), last + self.PREFETCH)
+    
+    def set_entries(self, entries: List[str], formatted: Optional[Dict[str, str]] = None):
+        """Visa nya poster; formatted innehåller redan formaterade rader"""
+        # Behåll bara formateringar för rader som fortfarande finns
+        known = {**self._formatted, **(formatted or {})}
+        self._formatted = {raw: known[raw] for raw in entries if raw in known}
+        
+        self._entries = entries
+        texts = list(map(self._formatted.get, entries, entries))
+        self._shown = list(map(self._formatted.__contains__, entries))
+        self._line_counts = [text.count('\n') + 1 for text in texts]
+        
+        # insertText flyttar skrollisten; _format_visible får inte köras mitt i
+        # bytet, då stämmer _lines ännu inte med dokumentet
+        self._formatting = True
+        try:
+            self.set_preview_text('\n\n'.join(texts))
+        finally:
+            self._formatting = False
+        self._format_visible()
+    
+    def _format_visible(self):
+        """Formattera de poster som syns men fortfarande visas råa"""
+        if self._formatting:
+            return
+        self._formatting = True
+        try:
+            first, last = self.visible_entry_range()
+            for index in range(first, last):
+                if self._shown[index]:
+                    continue
+                self._shown[index] = True
+                raw = self._entries[index]
+                text = self._formatted.get(raw)
+                if text is None:
+                    text = self._formatted[raw] = _format_preview_line(raw)
+                if text == raw:
+                    continue
+                
+                start = sum(self._line_counts[:index]) + index
+                new_lines = text.split('\n')
+                self._replace_lines(start, start + self._line_counts[index], new_lines)
+                self._line_counts[index] = len(new_lines)
+        finally:
+            self._formatting = False
+    
+    def set_preview_text(self, text: str):
+        """
+        Visa text genom att bara ersätta raderna som skiljer sig från den
+        nuvarande texten, så att oförändrade block behåller sin syntaxmarkering.
+        """
+        new_lines = text.split('\n')
+        start, old_end, new_end = _changed_range(self._lines, new_lines)
+        if start == old_end and start == new_end:
+            return
+        self._replace_lines(start, old_end, new_lines[start:new_end])
+    
+    def _replace_lines(self, start: int, end: int, new_lines: List[str]):
+        """Ersätt visade rader [start, end) med new_lines"""
+        old_lines = self._lines
+        
+        # Varje rad räknas med ett avslutande radbrytningstecken; det sista
+        # finns inte i dokumentet och justeras bort nedan
+        document = self.document()
+        length = document.characterCount() - 1
+        
+        def position(block_number: int) -> int:
+            if block_number < len(old_lines):
+                return document.findBlockByNumber(block_number).position()
+            return length + 1
+        
+        first, last = position(start), position(end)
+        replacement = ''.join(line + '\n' for line in new_lines)
+        if first > length:
+            # Rader läggs till sist i dokumentet
+            first = last = length
+            replacement = '\n' + replacement[:-1]
+        elif last > length:
+            last = length
+            if replacement:
+                replacement = replacement[:-1]
+            else:
+                first -= 1  # Ta bort radbrytningen före de borttagna raderna
+        
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        cursor.setPosition(first)
+        cursor.setPosition(last, QTextCursor.KeepAnchor)
+        cursor.insertText(replacement)
+        cursor.endEditBlock()
+        old_lines[start:end] = new_lines
 
 class JsonEditor(QWidget):
     """
@@ -118,6 +406,23 @@ class JsonEditor(QWidget):
         self.validation_timer.setSingleShot(True)
         self.validation_timer.timeout.connect(self.validate_current)
         
+        # Förhandsvisningen formateras i bakgrunden, efter en kort paus i skrivandet
+        self.preview_timer = QTimer()
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.timeout.connect(self.update_preview)
+        self.preview_timer.timeout.connect(self.emit_preview)
+        self.preview_pool = QThreadPool.globalInstance()
+        self._preview_generation = 0
+        self._load_generation = 0
+        self._pending_load = None  # (fil, statusmeddelande, timeout, felhanterare)
+        # (dokumentrevision, text, rader) för editorns senast lästa innehåll
+        self._text_cache = (-1, '', [])
+        # (dokumentrevision, sökterm) -> träffarnas startpositioner i dokumentet
+        self._search_idx = {}
+        # Parsade objekt per rad i _parsed_lines, _INVALID för tomma/ogiltiga rader
+        self._parsed_lines: List[str] = []
+        self._parsed: List[Any] = []
+        
         # Initiera UI
         self.init_ui()
         self.setup_shortcuts()
@@ -264,24 +569,18 @@ class JsonEditor(QWidget):
             # Sort by modification time to get the latest
             latest_file = max(jsonl_files, key=lambda p: p.stat().st_mtime)
             
-            # Load the file content
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Update editor content
-            self.editor.setPlainText(content)
-            self.current_file = latest_file
-            
-            # Update status
-            self.status_bar.showMessage(f"Loaded {latest_file.name}", 3000)
-            self.is_modified = False
-            
-            # Update preview
-            self.update_preview()
+            # Load the file content in the background and update the editor
+            _parse_line.cache_clear()
+            self._load_document(latest_file, f"Loaded {latest_file.name}", 3000,
+                                lambda error: self._on_product_load_error(product_id, error))
             
         except Exception as e:
-            self.status_bar.showMessage(f"Error loading product {product_id}: {str(e)}", 5000)
-            logger.error(f"Error loading product {product_id}: {str(e)}")
+            self._on_product_load_error(product_id, str(e))
+    
+    def _on_product_load_error(self, product_id: str, error: str):
+        """Visa fel vid inläsning av en produkt"""
+        self.status_bar.showMessage(f"Error loading product {product_id}: {error}", 5000)
+        logger.error(f"Error loading product {product_id}: {error}")
     
     def open_file(self, file_path: Optional[Path] = None):
         """Öppna en JSONL-fil för redigering"""
@@ -294,25 +593,69 @@ class JsonEditor(QWidget):
             if not file_path:
                 return
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            self.current_file = Path(file_path)
-            self.editor.setPlainText(content)
-            self.update_preview()
-            self.is_modified = False
-            self.status_bar.showMessage(f"Öppnade {self.current_file.name}")
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Fel", f"Kunde inte öppna fil: {str(e)}")
+        file_path = Path(file_path)
+        _parse_line.cache_clear()
+        self._load_document(
+            file_path, f"Öppnade {file_path.name}",
+            on_error=lambda error: QMessageBox.warning(self, "Fel", f"Kunde inte öppna fil: {error}")
+        )
+    
+    def _load_document(self, file_path: Path, message: str, timeout: int = 0,
+                       on_error: Optional[Callable[[str], None]] = None):
+        """Läs in en fil i bakgrunden och byt in dess dokument när det är klart"""
+        self._load_generation += 1
+        self._pending_load = (file_path, message, timeout, on_error)
+        self.status_bar.showMessage(f"Läser in {file_path.name}...")
+        
+        job = _DocumentLoadJob(file_path, self._load_generation)
+        job.signals.finished.connect(self._on_document_loaded, Qt.QueuedConnection)
+        job.signals.failed.connect(self._on_document_failed, Qt.QueuedConnection)
+        self.preview_pool.start(job)
+    
+    @Slot(int, str)
+    def _on_document_failed(self, generation: int, error: str):
+        """Rapportera ett fel från inläsningsjobbet"""
+        if generation != self._load_generation:
+            return
+        _, _, _, on_error = self._pending_load
+        self._pending_load = None
+        self.status_bar.clearMessage()
+        if on_error:
+            on_error(error)
+    
+    @Slot(int, object)
+    def _on_document_loaded(self, generation: int, document: QTextDocument):
+        """Byt in ett färdigbyggt dokument i editorn"""
+        if generation != self._load_generation:
+            return  # En senare inläsning har startats
+        file_path, message, timeout, _ = self._pending_load
+        self._pending_load = None
+        
+        document.setDocumentLayout(QPlainTextDocumentLayout(document))
+        document.setDefaultFont(self.editor.font())
+        document.setParent(self.editor)
+        
+        # QPlainTextEdit tar bara bort sitt eget standarddokument, tidigare
+        # inlästa dokument (med sina highlighters) städas bort här
+        old_document = self.editor.document()
+        owned = old_document.parent() is self.editor
+        self.editor.setDocument(document)
+        if owned:
+            old_document.deleteLater()
+        self.highlighter = document.findChild(JsonSyntaxHighlighter)
+        self._text_cache = (-1, '', [])
+        
+        self.current_file = file_path
+        self.is_modified = False
+        self.status_bar.showMessage(message, timeout)
+        self.update_preview()
     
     def save_current_file(self):
         """Save current file if it exists"""
         try:
             if self.current_file and self.is_modified:
                 with open(self.current_file, 'w', encoding='utf-8') as f:
-                    f.write(self.editor.toPlainText())
+                    f.write(self._current_lines()[0])
                 self.is_modified = False
                 self.status_bar.showMessage(f"Saved {self.current_file.name}", 3000)
                 return True
@@ -321,20 +664,22 @@ class JsonEditor(QWidget):
             self.status_bar.showMessage(f"Error saving file: {str(e)}", 5000)
             return False
     
+    def _current_lines(self):
+        """Editorns text och rader, delade mellan anrop så länge dokumentet är oförändrat"""
+        revision = self.editor.document().revision()
+        if revision != self._text_cache[0]:
+            text = self.editor.toPlainText()
+            self._text_cache = (revision, text, text.splitlines())
+        return self._text_cache[1], self._text_cache[2]
+    
     def format_json(self):
         """Formattera JSON/JSONL för bättre läsbarhet"""
         try:
-            text = self.editor.toPlainText()
-            formatted_lines = []
+            _, lines = self._current_lines()
+            lines = [line for line in lines if line and not line.isspace()]
             
-            for line in text.splitlines():
-                if line.strip():
-                    # Parse och formattera varje JSON-objekt
-                    data = json.loads(line)
-                    formatted = json.dumps(data, ensure_ascii=False, indent=2)
-                    # Konvertera till en rad
-                    formatted_line = formatted.replace('\n', '')
-                    formatted_lines.append(formatted_line)
+            # Parse och formattera varje JSON-objekt till en rad
+            formatted_lines = _map_lines(_format_compact_line, lines)
             
             self.editor.setPlainText('\n'.join(formatted_lines))
             self.status_bar.showMessage("JSON formaterad")
@@ -345,11 +690,11 @@ class JsonEditor(QWidget):
 
     def validate_current(self) -> bool:
         """Validera aktuell JSON/JSONL"""
-        text = self.editor.toPlainText()
+        _, lines = self._current_lines()
         try:
-            for line in text.splitlines():
-                if line.strip():
-                    json.loads(line)
+            for line in lines:
+                if line and not line.isspace():
+                    _parse_line(line)
             self.status_bar.showMessage("Validation OK", 3000)
             return True
             
@@ -389,96 +734,118 @@ class JsonEditor(QWidget):
         # Sök från nuvarande position
         self.find_next()
     
+    def _search_offsets(self, term: str) -> List[int]:
+        """Startpositioner för alla träffar på term, cachade per dokumentrevision"""
+        key = (self.editor.document().revision(), term)
+        offsets = self._search_idx.get(key)
+        if offsets is None:
+            text, _ = self._current_lines()
+            # Dokumentpositioner räknas i UTF-16, som skiljer sig från
+            # Python-index först när texten innehåller tecken utanför BMP
+            wide = len(text.encode('utf-16-le')) // 2 != len(text)
+            offsets = []
+            position = last = 0
+            for match in re.finditer(re.escape(term), text, re.IGNORECASE):
+                if wide:
+                    position += len(text[last:match.start()].encode('utf-16-le')) // 2
+                    last = match.start()
+                    offsets.append(position)
+                else:
+                    offsets.append(match.start())
+            self._search_idx[key] = offsets
+        return offsets
+    
+    def _select_match(self, term: str, start: int):
+        """Markera träffen som börjar på start"""
+        cursor = self.editor.textCursor()
+        cursor.setPosition(start)
+        cursor.setPosition(start + len(term.encode('utf-16-le')) // 2, QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+    
     def find_next(self):
         """Hitta nästa träff på söktexten"""
-        if not self.search_input.text():
+        term = self.search_input.text()
+        if not term:
+            return
+        
+        offsets = self._search_offsets(term)
+        if not offsets:
+            self.status_bar.showMessage("Ingen träff hittad", 3000)
             return
         
-        found = self.editor.find(self.search_input.text())
-        if not found:
+        index = bisect.bisect_left(offsets, self.editor.textCursor().selectionEnd())
+        if index == len(offsets):
             # Om vi inte hittar något, börja från början
-            cursor = self.editor.textCursor()
-            cursor.movePosition(cursor.Start)
-            self.editor.setTextCursor(cursor)
-            # Försök hitta igen från början
-            found = self.editor.find(self.search_input.text())
-            if found:
-                self.status_bar.showMessage("Sökningen fortsätter från början", 3000)
-            else:
-                self.status_bar.showMessage("Ingen träff hittad", 3000)
+            index = 0
+            self.status_bar.showMessage("Sökningen fortsätter från början", 3000)
+        self._select_match(term, offsets[index])
 
     def find_previous(self):
         """Hitta föregående träff på söktexten"""
-        if not self.search_input.text():
+        term = self.search_input.text()
+        if not term:
             return
         
-        found = self.editor.find(self.search_input.text(), self.editor.FindBackward)
-        if not found:
+        offsets = self._search_offsets(term)
+        if not offsets:
+            self.status_bar.showMessage("Ingen träff hittad", 3000)
+            return
+        
+        index = bisect.bisect_left(offsets, self.editor.textCursor().selectionStart()) - 1
+        if index < 0:
             # Om vi inte hittar något, börja från slutet
-            cursor = self.editor.textCursor()
-            cursor.movePosition(cursor.End)
-            self.editor.setTextCursor(cursor)
-            # Försök hitta igen från slutet
-            found = self.editor.find(self.search_input.text(), self.editor.FindBackward)
-            if found:
-                self.status_bar.showMessage("Sökningen fortsätter från slutet", 3000)
-            else:
-                self.status_bar.showMessage("Ingen träff hittad", 3000)
+            index = len(offsets) - 1
+            self.status_bar.showMessage("Sökningen fortsätter från slutet", 3000)
+        self._select_match(term, offsets[index])
 
     def on_text_changed(self):
         """Handle text changes in the editor"""
         # Set modified flag
         self.is_modified = True
+        self._search_idx.clear()
         
         # Start validation timer to avoid validating on every keystroke
         self.validation_timer.start(1000)  # Validate after 1 second of no typing
         
-        # Update preview
-        self.update_preview()
-        
-        # Emit preview signal
-        self.emit_preview()
+        # Update and emit preview once typing pauses
+        self.preview_timer.start(200)
     
     def update_preview(self):
         """Update the preview with formatted content"""
         try:
-            text = self.editor.toPlainText()
-            formatted_lines = []
-            
-            for line in text.splitlines():
-                if line.strip():
-                    # Parse and format each JSON object
-                    try:
-                        data = json.loads(line)
-                        formatted = json.dumps(data, ensure_ascii=False, indent=2)
-                        formatted_lines.append(formatted)
-                    except json.JSONDecodeError:
-                        # If line isn't valid JSON, show it as-is
-                        formatted_lines.append(line)
-            
-            # Join formatted lines with double newlines for spacing
-            preview_text = '\n\n'.join(formatted_lines)
-            self.preview.setPlainText(preview_text)
-            self.status_bar.showMessage("Preview updated", 3000)
+            # Nytt jobb gör alla pågående jobb inaktuella
+            self._preview_generation += 1
+            _, lines = self._current_lines()
+            job = _PreviewJob(lines, self.preview.visible_entry_range(), self._preview_generation,
+                              lambda: self._preview_generation)
+            job.signals.finished.connect(self._on_preview_ready, Qt.QueuedConnection)
+            self.preview_pool.start(job)
             
         except Exception as e:
             self.status_bar.showMessage(f"Preview error: {str(e)}", 3000)
             logger.error(f"Error updating preview: {str(e)}")
+    
+    @Slot(int, object)
+    def _on_preview_ready(self, generation: int, result: Tuple[List[str], Dict[str, str]]):
+        """Visa resultatet från det senaste förhandsvisningsjobbet"""
+        if generation != self._preview_generation:
+            return
+        entries, formatted = result
+        self.preview.set_entries(entries, formatted)
+        self.status_bar.showMessage("Preview updated", 3000)
+
+    def _sync_parsed(self, lines: List[str]):
+        """Parsa om bara de rader som ändrats sedan förra anropet"""
+        start, old_end, new_end = _changed_range(self._parsed_lines, lines)
+        self._parsed[start:old_end] = map(_parse_or_invalid, lines[start:new_end])
+        self._parsed_lines = lines
 
     def emit_preview(self):
         """Emit preview data to connected viewers"""
         try:
-            text = self.editor.toPlainText()
-            data = []
-            
-            # Parse each line as JSON
-            for line in text.splitlines():
-                if line.strip():
-                    try:
-                        json_obj = json.loads(line)
-                        data.append(json_obj)
-                    except json.JSONDecodeError:
-                        continue
+            _, lines = self._current_lines()
+            self._sync_parsed(lines)
+            data = [obj for obj in self._parsed if obj is not _INVALID]
             
             # Emit preview signal with parsed data
             self.preview_updated.emit("jsonl", {"content": data})
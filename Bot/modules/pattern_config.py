@@ -1,166 +1,336 @@
 # modules/pattern_config.py
 
 import re
+import os
+import sys
 import json
+import threading
 import logging
+import importlib.util
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Union, Any, NamedTuple, Tuple
 from datetime import datetime
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, OrderedDict
+
+# Use orjson for reading pattern files when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# RE2 gives linear-time matching for combined patterns (optional dependency)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+# Hyperscan is used as a prefilter for bulk extraction (optional dependency)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+def _load_json_file(path: Path) -> Any:
+    """Read and parse a JSON file, with orjson when available"""
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. integers wider than 64 bits, let json decide
+    return json.loads(data)
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, with orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+# Maximum number of compiled patterns to cache, same limit as the re module's own cache
+_PATTERN_CACHE_SIZE = 512
+
+# Delay before changes from add_pattern/remove_pattern are written to disk
+_SAVE_DELAY = 0.5
+
+# Standalone digit runs for suggest_patterns
+_NUMBER_RUN = re.compile(r'\b\d+\b')
+
+# Byte table for ASCII text: digits are kept, word characters become 'a', everything else a space
+_DIGIT_RUN_TABLE = bytes(
+    c if 48 <= c <= 57 else 97 if (65 <= c <= 90 or 97 <= c <= 122 or c == 95) else 32
+    for c in range(256)
+)
+
+def _number_lengths(text: str) -> Counter:
+    """Count the lengths of standalone numbers, same as matching \b\d+\b"""
+    if text.isascii():
+        # Translate and split on whitespace in C, no regex calls
+        tokens = text.encode('ascii').translate(_DIGIT_RUN_TABLE).split()
+        return Counter(len(token) for token in tokens if token.isdigit())
+    return Counter(match.end() - match.start() for match in _NUMBER_RUN.finditer(text))
+
+# Default patterns; every PatternConfig gets its own copy
+_DEFAULT_PATTERNS = {
+    "article": {
+        "ean13": {
+            "patterns": [
+                r'(?i)EAN(?:-13)?[:.\-]?\s*(\d{13})(?!\d)',
+                r'(?i)(?:Global Trade Item Number|EAN-kod)[:.\-]?\s*(\d{13})(?!\d)',
+                r'(?<!\d)(\d{13})(?!\d)'
+            ],
+            "validation": r'^\d{13}$',
+            "priority": "high"
+        },
+        "article_number": {
+            "patterns": [
+                r'(?i)Art(?:ikel)?\.?(?:nr|nummer)\.?\s*:\s*([A-Z0-9\-]{5,15})',
+                r'(?i)Produkt(?:nr|nummer)\.?\s*:\s*([A-Z0-9\-]{5,15})'
+            ],
+            "validation": r'^[A-Z0-9\-]{5,15}$',
+            "priority": "high"
+        },
+        "copiax_article": {
+            "patterns": [
+                r'(?i)(?<!\d)(50\d{6})(?!\d)',
+                r'(?i)Copiax-artikel\s*:\s*(50\d{6})'
+            ],
+            "validation": r'^50\d{6}$',
+            "priority": "medium"
+        }
+    },
+    "technical": {
+        "dimensions": {
+            "patterns": [
+                r'(?i)(?:Mått|Dimensioner)\s*:\s*(\d+(?:[,.]\d+)?)\s*(?:x|\*)\s*(\d+(?:[,.]\d+)?)\s*(?:x|\*)\s*(\d+(?:[,.]\d+)?)\s*(?:mm|cm|m)',
+                r'(?i)(?:Höjd|Bredd|Djup)\s*:\s*(\d+(?:[,.]\d+)?)\s*(?:mm|cm|m)'
+            ],
+            "validation": r'^\d+(?:[,.]\d+)?$',
+            "priority": "high"
+        },
+        "electrical": {
+            "patterns": [
+                r'(?i)(?:Spänning|Voltage)\s*:\s*(\d+(?:[,.]\d+)?)\s*(?:V|kV|mV)',
+                r'(?i)(?:Ström|Current)\s*:\s*(\d+(?:[,.]\d+)?)\s*(?:A|mA)'
+            ],
+            "validation": r'^\d+(?:[,.]\d+)?$',
+            "priority": "high"
+        },
+        "material": {
+            "patterns": [
+                r'(?i)Material\s*:\s*([^\.;]+)',
+                r'(?i)Tillverkad av\s*:\s*([^\.;]+)'
+            ],
+            "validation": r'^[A-Za-zåäöÅÄÖ\s\-,]+$',
+            "priority": "medium"
+        },
+        "color": {
+            "patterns": [
+                r'(?i)Färg\s*:\s*([^\.;]+)',
+                r'(?i)Kulör\s*:\s*([^\.;]+)'
+            ],
+            "validation": r'^[A-Za-zåäöÅÄÖ\s\-,]+$',
+            "priority": "low"
+        }
+    },
+    "compatibility": {
+        "direct": {
+            "patterns": [
+                r'(?i)kompatibel\s+med\s+([^\.;]+)(?:\.|\;|$)',
+                r'(?i)fungerar\s+med\s+([^\.;]+)(?:\.|\;|$)',
+                r'(?i)passar\s+till\s+([^\.;]+)(?:\.|\;|$)'
+            ],
+            "validation": None,
+            "priority": "high"
+        },
+        "requires": {
+            "patterns": [
+                r'(?i)kräver\s+([^\.;]+)(?:\.|\;|$)',
+                r'(?i)måste\s+ha\s+([^\.;]+)(?:\.|\;|$)'
+            ],
+            "validation": None,
+            "priority": "high"
+        },
+        "fits": {
+            "patterns": [
+                r'(?i)passar\s+i\s+([^\.;]+)(?:\.|\;|$)',
+                r'(?i)monteras\s+på\s+([^\.;]+)(?:\.|\;|$)'
+            ],
+            "validation": None,
+            "priority": "medium"
+        }
+    }
+}
+
+# File type specific overrides
+_DEFAULT_FILE_TYPE_PATTERNS = {
+    "_pro": {
+        "article": {
+            "ean13": {
+                "patterns": [
+                    r'(?i)EAN(?:-13)?(?:[-:]|\s+)\s*(\d{13})(?!\d)',
+                    r'(?i)GTIN(?:-13)?(?:[-:]|\s+)\s*(\d{13})(?!\d)'
+                ]
+            }
+        }
+    },
+    "_produktblad": {
+        "technical": {
+            "dimensions": {
+                "patterns": [
+                    r'(?i)(?:Dimensioner|Storlek|Mått)[\s:]*\n\s*(?:B|H|D|L)?\s*[xX]\s*(?:B|H|D|L)?\s*[xX]?\s*(?:B|H|D|L)?\s*[:=]?\s*(\d+(?:[.,]\d+)?)\s*(?:mm|cm|m)\s*[xX]\s*(\d+(?:[.,]\d+)?)\s*(?:mm|cm|m)(?:\s*[xX]\s*(\d+(?:[.,]\d+)?)\s*(?:mm|cm|m))?'
+                ]
+            }
+        }
+    }
+}
+
+# Default validation patterns are compiled once at import
+_DEFAULT_VALIDATORS: Dict[Tuple[str, str], re.Pattern] = {
+    (category, subcategory): re.compile(entry["validation"])
+    for category, subcats in _DEFAULT_PATTERNS.items()
+    for subcategory, entry in subcats.items()
+    if entry.get("validation")
+}
+
+def _copy_patterns(tree: Any) -> Any:
+    """Copy nested pattern dicts and lists; strings are shared"""
+    if isinstance(tree, dict):
+        return {key: _copy_patterns(value) for key, value in tree.items()}
+    if isinstance(tree, list):
+        return list(tree)
+    return tree
+
+# Common compatibility phrases for suggest_patterns
+_COMPATIBILITY_PHRASES = (
+    r'passar med',
+    r'fungerar tillsammans med',
+    r'kan användas med',
+    r'är kompatibel med'
+)
+
+# Global inline flags, e.g. (?i), at the start of a pattern
+_LEADING_FLAGS = re.compile(r'^\(\?([aiLmsux]+)\)')
+
+# Numbered backreferences and conditionals, which would point at the wrong group once joined
+_BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+def _scoped_pattern(pattern: str) -> str:
+    """Turn leading global inline flags into a scoped group so patterns can be joined"""
+    match = _LEADING_FLAGS.match(pattern)
+    if match:
+        return f"(?{match.group(1)}:{pattern[match.end():]})"
+    return pattern
+
+class _PatternCache(OrderedDict):
+    """Compiled pattern cache that evicts the least recently used entries"""
+    
+    def __init__(self, maxsize: int = _PATTERN_CACHE_SIZE):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def get(self, key, default=None):
+        if key in self:
+            self.move_to_end(key)
+            return super().__getitem__(key)
+        return default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+class ResolvedEntry(NamedTuple):
+    """Resolved patterns and settings for one category/subcategory/file type"""
+    patterns: Tuple[str, ...]
+    compiled: Tuple[re.Pattern, ...]
+    validation: Optional[str]
+    validator: Optional[re.Pattern]
+    priority: str
+
+_EMPTY_ENTRY = ResolvedEntry((), (), None, None, "low")
+
 class PatternConfig:
     """
     Configuration class for managing regex patterns used in data extraction.
     Handles loading, validation, and application of patterns for different document types.
     """
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, codegen: bool = False):
         # Default configuration path
         self.config_path = config_path or Path("config/patterns.json")
         
+        # Compiled pattern cache (must exist before load_patterns runs)
+        self._pattern_cache = _PatternCache()
+        
+        # Flat lookup table per (category, subcategory, file_type)
+        self._resolved = {}
+        
+        # Memoized get_pattern_info, cleared when the patterns change
+        self._pattern_info_cached = functools.lru_cache(maxsize=256)(self._resolve_info)
+        
+        # Combined alternation per (category, subcategory, file_type)
+        self._combined_cache = {}
+        
+        # Hyperscan database per file type
+        self._hyperscan_cache = {}
+        
+        # Debounced saving of changes
+        self._dirty = False
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        
+        # Guards self.patterns/file_type_patterns against the save timer thread
+        self._data_lock = threading.RLock()
+        
+        # Generated extraction module, built on the first extract() (see generate_module)
+        self.codegen = codegen
+        self._generated = None
+        
         # Initialize pattern categories
         self._init_default_patterns()
         
         # Load custom patterns if they exist
         self.load_patterns()
         
-        # Compiled pattern cache
-        self._pattern_cache = {}
+        # Compile all patterns up front so the first lookup does not have to
+        self._compile_all()
     
     def _init_default_patterns(self):
         """Initialize default pattern sets for different categories"""
-        self.patterns = {
-            "article": {
-                "ean13": {
-                    "patterns": [
-                        r'(?i)EAN(?:-13)?[:.\-]?\s*(\d{13})(?!\d)',
-                        r'(?i)(?:Global Trade Item Number|EAN-kod)[:.\-]?\s*(\d{13})(?!\d)',
-                        r'(?<!\d)(\d{13})(?!\d)'
-                    ],
-                    "validation": r'^\d{13}$',
-                    "priority": "high"
-                },
-                "article_number": {
-                    "patterns": [
-                        r'(?i)Art(?:ikel)?\.?(?:nr|nummer)\.?\s*:\s*([A-Z0-9\-]{5,15})',
-                        r'(?i)Produkt(?:nr|nummer)\.?\s*:\s*([A-Z0-9\-]{5,15})'
-                    ],
-                    "validation": r'^[A-Z0-9\-]{5,15}$',
-                    "priority": "high"
-                },
-                "copiax_article": {
-                    "patterns": [
-                        r'(?i)(?<!\d)(50\d{6})(?!\d)',
-                        r'(?i)Copiax-artikel\s*:\s*(50\d{6})'
-                    ],
-                    "validation": r'^50\d{6}$',
-                    "priority": "medium"
-                }
-            },
-            "technical": {
-                "dimensions": {
-                    "patterns": [
-                        r'(?i)(?:Mått|Dimensioner)\s*:\s*(\d+(?:[,.]\d+)?)\s*(?:x|\*)\s*(\d+(?:[,.]\d+)?)\s*(?:x|\*)\s*(\d+(?:[,.]\d+)?)\s*(?:mm|cm|m)',
-                        r'(?i)(?:Höjd|Bredd|Djup)\s*:\s*(\d+(?:[,.]\d+)?)\s*(?:mm|cm|m)'
-                    ],
-                    "validation": r'^\d+(?:[,.]\d+)?$',
-                    "priority": "high"
-                },
-                "electrical": {
-                    "patterns": [
-                        r'(?i)(?:Spänning|Voltage)\s*:\s*(\d+(?:[,.]\d+)?)\s*(?:V|kV|mV)',
-                        r'(?i)(?:Ström|Current)\s*:\s*(\d+(?:[,.]\d+)?)\s*(?:A|mA)'
-                    ],
-                    "validation": r'^\d+(?:[,.]\d+)?$',
-                    "priority": "high"
-                },
-                "material": {
-                    "patterns": [
-                        r'(?i)Material\s*:\s*([^\.;]+)',
-                        r'(?i)Tillverkad av\s*:\s*([^\.;]+)'
-                    ],
-                    "validation": r'^[A-Za-zåäöÅÄÖ\s\-,]+$',
-                    "priority": "medium"
-                },
-                "color": {
-                    "patterns": [
-                        r'(?i)Färg\s*:\s*([^\.;]+)',
-                        r'(?i)Kulör\s*:\s*([^\.;]+)'
-                    ],
-                    "validation": r'^[A-Za-zåäöÅÄÖ\s\-,]+$',
-                    "priority": "low"
-                }
-            },
-            "compatibility": {
-                "direct": {
-                    "patterns": [
-                        r'(?i)kompatibel\s+med\s+([^\.;]+)(?:\.|\;|$)',
-                        r'(?i)fungerar\s+med\s+([^\.;]+)(?:\.|\;|$)',
-                        r'(?i)passar\s+till\s+([^\.;]+)(?:\.|\;|$)'
-                    ],
-                    "validation": None,
-                    "priority": "high"
-                },
-                "requires": {
-                    "patterns": [
-                        r'(?i)kräver\s+([^\.;]+)(?:\.|\;|$)',
-                        r'(?i)måste\s+ha\s+([^\.;]+)(?:\.|\;|$)'
-                    ],
-                    "validation": None,
-                    "priority": "high"
-                },
-                "fits": {
-                    "patterns": [
-                        r'(?i)passar\s+i\s+([^\.;]+)(?:\.|\;|$)',
-                        r'(?i)monteras\s+på\s+([^\.;]+)(?:\.|\;|$)'
-                    ],
-                    "validation": None,
-                    "priority": "medium"
-                }
-            }
-        }
+        self.patterns = _copy_patterns(_DEFAULT_PATTERNS)
         
         # File type specific overrides
-        self.file_type_patterns = {
-            "_pro": {
-                "article": {
-                    "ean13": {
-                        "patterns": [
-                            r'(?i)EAN(?:-13)?(?:[-:]|\s+)\s*(\d{13})(?!\d)',
-                            r'(?i)GTIN(?:-13)?(?:[-:]|\s+)\s*(\d{13})(?!\d)'
-                        ]
-                    }
-                }
-            },
-            "_produktblad": {
-                "technical": {
-                    "dimensions": {
-                        "patterns": [
-                            r'(?i)(?:Dimensioner|Storlek|Mått)[\s:]*\n\s*(?:B|H|D|L)?\s*[xX]\s*(?:B|H|D|L)?\s*[xX]?\s*(?:B|H|D|L)?\s*[:=]?\s*(\d+(?:[.,]\d+)?)\s*(?:mm|cm|m)\s*[xX]\s*(\d+(?:[.,]\d+)?)\s*(?:mm|cm|m)(?:\s*[xX]\s*(\d+(?:[.,]\d+)?)\s*(?:mm|cm|m))?'
-                        ]
-                    }
-                }
-            }
-        }
+        self.file_type_patterns = _copy_patterns(_DEFAULT_FILE_TYPE_PATTERNS)
     
     def load_patterns(self):
         """Load patterns from configuration file"""
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = _load_json_file(self.config_path)
                 
                 # Update patterns with loaded configuration
-                if "patterns" in config:
-                    self._merge_patterns(self.patterns, config["patterns"])
-                
-                if "file_type_patterns" in config:
-                    self._merge_patterns(self.file_type_patterns, config["file_type_patterns"])
+                with self._data_lock:
+                    if "patterns" in config:
+                        self._merge_patterns(self.patterns, config["patterns"])
+                    
+                    if "file_type_patterns" in config:
+                        self._merge_patterns(self.file_type_patterns, config["file_type_patterns"])
                 
-                # Clear pattern cache after loading new patterns
+                # Rebuild pattern cache after loading new patterns
                 self._pattern_cache.clear()
+                self._clear_combined()
+                self._compile_all()
                 
                 logger.info(f"Successfully loaded patterns from {self.config_path}")
                 
@@ -170,17 +340,21 @@ class PatternConfig:
     def save_patterns(self):
         """Save current patterns to configuration file"""
         try:
-            config = {
-                "patterns": self.patterns,
-                "file_type_patterns": self.file_type_patterns,
-                "last_updated": datetime.now().isoformat()
-            }
+            # Snapshot under the lock; this may run on the save timer thread
+            with self._data_lock:
+                config = {
+                    "patterns": _copy_patterns(self.patterns),
+                    "file_type_patterns": _copy_patterns(self.file_type_patterns),
+                    "last_updated": datetime.now().isoformat()
+                }
             
             # Create config directory if it doesn't exist
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=4)
+            # Write to a temporary file and swap it in atomically
+            tmp_path = self.config_path.with_suffix('.tmp')
+            tmp_path.write_bytes(_dump_json(config))
+            os.replace(tmp_path, self.config_path)
             
             logger.info(f"Successfully saved patterns to {self.config_path}")
             
@@ -188,13 +362,157 @@ class PatternConfig:
             logger.error(f"Error saving patterns to {self.config_path}: {str(e)}")
             raise
     
+    def _schedule_save(self):
+        """Mark patterns as changed and save them after a short delay"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(_SAVE_DELAY, self._flush)
+                self._save_timer.start()
+    
+    def flush(self):
+        """Write pending pattern changes to disk immediately"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                self.save_patterns()
+            except Exception:
+                # Keep the changes pending so the next save writes them
+                self._dirty = True
+                raise
+    
+    def _flush(self):
+        """Timer callback for delayed saves"""
+        try:
+            self.flush()
+        except Exception:
+            pass  # save_patterns has already logged the error
+    
     def _merge_patterns(self, base: Dict, update: Dict):
-        """Recursively merge pattern dictionaries"""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_patterns(base[key], value)
-            else:
-                base[key] = value
+        """Merge pattern dictionaries in place using an explicit worklist"""
+        stack = [(base, update)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
+    
+    def _iter_pattern_lists(self):
+        """Yield every pattern list from base and file type specific patterns"""
+        for category in self.patterns.values():
+            for subcat in category.values():
+                yield subcat.get("patterns", [])
+        
+        for file_type in self.file_type_patterns.values():
+            for category in file_type.values():
+                for subcat in category.values():
+                    yield subcat.get("patterns", [])
+    
+    def _iter_patterns(self):
+        """Yield every pattern string from base and file type specific patterns"""
+        for patterns in self._iter_pattern_lists():
+            yield from patterns
+    
+    def _compile_all(self):
+        """Compile all known patterns into the pattern cache"""
+        for patterns in self._iter_pattern_lists():
+            for i, pattern in enumerate(patterns):
+                if not isinstance(pattern, str):
+                    continue
+                
+                # Interned strings let duplicates share both the string and the compiled pattern
+                pattern = patterns[i] = sys.intern(pattern)
+                if pattern in self._pattern_cache:
+                    continue
+                try:
+                    self._pattern_cache[pattern] = re.compile(pattern, re.MULTILINE | re.DOTALL)
+                except re.error as e:
+                    logger.error(f"Error compiling pattern '{pattern}': {str(e)}")
+                    self._pattern_cache[pattern] = e
+        
+        self._resolve_all()
+    
+    def _compile_validation(self, validation: Optional[str]) -> Optional[re.Pattern]:
+        """Compile a validation pattern, returning None if it is invalid"""
+        if not validation:
+            return None
+        try:
+            return re.compile(validation)
+        except re.error as e:
+            logger.error(f"Error compiling validation pattern '{validation}': {str(e)}")
+            return None
+    
+    def _resolve_all(self):
+        """Build the flat (category, subcategory, file_type) lookup table"""
+        resolved = {}
+        
+        for category, subcats in self.patterns.items():
+            for subcategory, subcat in subcats.items():
+                validation = subcat.get("validation")
+                patterns = tuple(subcat.get("patterns", []))
+                
+                # Reuse the default validator unless the validation pattern was overridden
+                validator = _DEFAULT_VALIDATORS.get((category, subcategory))
+                if validator is None or validator.pattern != validation:
+                    validator = self._compile_validation(validation)
+                
+                resolved[(category, subcategory, None)] = ResolvedEntry(
+                    patterns,
+                    self._compiled_tuple(patterns),
+                    validation,
+                    validator,
+                    subcat.get("priority", "low")
+                )
+        
+        for file_type, categories in self.file_type_patterns.items():
+            # Without an override the base patterns apply to the file type as well
+            for (category, subcategory, base_type), entry in list(resolved.items()):
+                if base_type is None:
+                    resolved[(category, subcategory, file_type)] = entry
+            
+            for category, subcats in categories.items():
+                for subcategory, subcat in subcats.items():
+                    if "patterns" not in subcat:
+                        continue
+                    base = resolved.get((category, subcategory, None), _EMPTY_ENTRY)
+                    patterns = tuple(subcat["patterns"])
+                    resolved[(category, subcategory, file_type)] = base._replace(
+                        patterns=patterns,
+                        compiled=self._compiled_tuple(patterns)
+                    )
+        
+        self._resolved = resolved
+        self._pattern_info_cached.cache_clear()
+    
+    def _compiled_tuple(self, patterns: List[str]) -> Tuple[re.Pattern, ...]:
+        """Get the successfully compiled patterns for a pattern list"""
+        return tuple(
+            compiled for compiled in map(self._try_compile, patterns)
+            if compiled is not None
+        )
+    
+    def _try_compile(self, pattern: str) -> Optional[re.Pattern]:
+        """Compile a pattern through the cache, returning None if it is invalid"""
+        try:
+            return self.compile_pattern(pattern)
+        except re.error:
+            return None
+    
+    def _resolve(self, category: str, subcategory: str,
+                 file_type: Optional[str] = None) -> ResolvedEntry:
+        """Look up the resolved entry, falling back to the base patterns"""
+        entry = self._resolved.get((category, subcategory, file_type))
+        if entry is None and file_type is not None:
+            entry = self._resolved.get((category, subcategory, None))
+        return entry or _EMPTY_ENTRY
     
     def get_patterns(self, category: str, subcategory: str, 
                     file_type: Optional[str] = None) -> List[str]:
@@ -202,87 +520,402 @@ class PatternConfig:
         Get patterns for a specific category and subcategory.
         Optionally considers file type specific patterns.
         """
-        patterns = []
-        
-        # Get base patterns
-        if (category in self.patterns and 
-            subcategory in self.patterns[category] and 
-            "patterns" in self.patterns[category][subcategory]):
-            patterns.extend(self.patterns[category][subcategory]["patterns"])
-        
-        # Apply file type specific patterns if available
-        if file_type and file_type in self.file_type_patterns:
-            if (category in self.file_type_patterns[file_type] and
-                subcategory in self.file_type_patterns[file_type][category] and
-                "patterns" in self.file_type_patterns[file_type][category][subcategory]):
-                # Replace base patterns with file type specific ones
-                patterns = self.file_type_patterns[file_type][category][subcategory]["patterns"]
-        
-        return patterns
+        # Fresh list so callers cannot modify the resolved table
+        return list(self._resolve(category, subcategory, file_type).patterns)
     
     def get_validation_pattern(self, category: str, subcategory: str) -> Optional[str]:
         """Get validation pattern for a category and subcategory"""
-        if (category in self.patterns and 
-            subcategory in self.patterns[category] and 
-            "validation" in self.patterns[category][subcategory]):
-            return self.patterns[category][subcategory]["validation"]
-        return None
+        return self._resolve(category, subcategory).validation
     
     def get_priority(self, category: str, subcategory: str) -> str:
         """Get priority level for a category and subcategory"""
-        if (category in self.patterns and 
-            subcategory in self.patterns[category] and 
-            "priority" in self.patterns[category][subcategory]):
-            return self.patterns[category][subcategory]["priority"]
-        return "low"
+        return self._resolve(category, subcategory).priority
     
     def compile_pattern(self, pattern: str) -> re.Pattern:
         """Compile a pattern and cache it"""
-        if pattern not in self._pattern_cache:
+        compiled = self._pattern_cache.get(pattern)
+        if compiled is None:
             try:
-                self._pattern_cache[pattern] = re.compile(pattern, re.MULTILINE | re.DOTALL)
+                compiled = re.compile(pattern, re.MULTILINE | re.DOTALL)
             except re.error as e:
                 logger.error(f"Error compiling pattern '{pattern}': {str(e)}")
-                raise
-        return self._pattern_cache[pattern]
+                compiled = e
+            self._pattern_cache[pattern] = compiled
+        
+        # Invalid patterns are cached as their re.error so they are not recompiled
+        if isinstance(compiled, re.error):
+            raise compiled
+        return compiled
+    
+    def _clear_combined(self):
+        """Drop combined matchers built from the current pattern set"""
+        self._combined_cache.clear()
+        self._hyperscan_cache.clear()
+        self._generated = None
+    
+    def _combined_source(self, items) -> Tuple[Optional[str], Dict[str, tuple], List[tuple]]:
+        """
+        Join (key, pattern) pairs into one (?P<__pN>...) alternation.
+        Returns the source, a map from group name to (key, group index, group count)
+        and the (key, compiled pattern) pairs that must be matched on their own.
+        """
+        alternatives = []
+        groups = {}
+        separate = []
+        group_index = 1
+        
+        for key, pattern in items:
+            try:
+                compiled = self.compile_pattern(pattern)
+            except re.error:
+                continue
+            
+            # Named groups would clash and backreferences would shift inside the alternation
+            if compiled.groupindex or _BACKREFERENCE.search(pattern.replace('\\\\', '')):
+                separate.append((key, compiled))
+                continue
+            
+            group_count = compiled.groups
+            name = f"__p{len(alternatives)}"
+            alternatives.append(f"(?P<{name}>{_scoped_pattern(pattern)})")
+            groups[name] = (key, group_index, group_count)
+            group_index += group_count + 1
+        
+        if not alternatives:
+            return None, groups, separate
+        
+        return "(?ms)" + "|".join(alternatives), groups, separate
+    
+    def _checked_source(self, items) -> Tuple[Optional[str], Dict[str, tuple], List[tuple]]:
+        """Like _combined_source, but falls back to separate patterns if the join does not compile"""
+        items = list(items)
+        source, groups, separate = self._combined_source(items)
+        if source is None:
+            return source, groups, separate
+        
+        try:
+            re.compile(source)
+        except re.error as e:
+            logger.warning(f"Could not combine patterns, matching them separately: {str(e)}")
+            separate = [
+                (key, compiled) for key, compiled in
+                ((key, self._try_compile(pattern)) for key, pattern in items)
+                if compiled is not None
+            ]
+            return None, {}, separate
+        
+        return source, groups, separate
+    
+    def _build_combined(self, patterns: List[str]):
+        """Join patterns into one alternation, using RE2 when available"""
+        source, groups, separate = self._checked_source((pattern, pattern) for pattern in patterns)
+        if source is None:
+            return None, groups, separate
+        
+        if RE2_AVAILABLE:
+            # RE2 lacks e.g. lookaround; fall back to the standard library then
+            try:
+                options = re2.Options()
+                options.log_errors = False
+                return re2.compile(source, options), groups, separate
+            except Exception:
+                pass
+        
+        return re.compile(source), groups, separate
+    
+    def _combined_pattern(self, category: str, subcategory: str,
+                         file_type: Optional[str] = None):
+        """Get the cached combined alternation for a category/subcategory"""
+        key = (category, subcategory, file_type)
+        combined = self._combined_cache.get(key)
+        if combined is None:
+            combined = self._build_combined(self.get_patterns(category, subcategory, file_type))
+            self._combined_cache[key] = combined
+        return combined
+    
+    def find_matches(self, text: str, category: str, subcategory: str,
+                     file_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Match all patterns of a subcategory in a single pass over the text.
+        Matches are non-overlapping; the first pattern that matches at a position wins.
+        Patterns with named groups or backreferences are matched on their own.
+        """
+        compiled, groups, separate = self._combined_pattern(category, subcategory, file_type)
+        
+        results = []
+        if compiled is not None:
+            for match in compiled.finditer(text):
+                pattern, first, count = groups[match.lastgroup]
+                results.append({
+                    "pattern": pattern,
+                    "full_match": match.group(first),
+                    "groups": [match.group(i) for i in range(first + 1, first + count + 1)],
+                    "start": match.start(),
+                    "end": match.end()
+                })
+        
+        if separate:
+            for pattern, single in separate:
+                for match in single.finditer(text):
+                    results.append({
+                        "pattern": pattern,
+                        "full_match": match.group(0),
+                        "groups": list(match.groups()),
+                        "start": match.start(),
+                        "end": match.end()
+                    })
+            results.sort(key=lambda result: result["start"])
+        
+        return results
+    
+    def _pattern_table(self, file_type: Optional[str] = None) -> List[tuple]:
+        """List (category, subcategory, pattern) for every pattern that applies to a file type"""
+        sections = dict.fromkeys(
+            (category, subcategory)
+            for category, subcats in self.patterns.items()
+            for subcategory in subcats
+        )
+        if file_type and file_type in self.file_type_patterns:
+            sections.update(dict.fromkeys(
+                (category, subcategory)
+                for category, subcats in self.file_type_patterns[file_type].items()
+                for subcategory in subcats
+            ))
+        
+        return [
+            (category, subcategory, pattern)
+            for category, subcategory in sections
+            for pattern in self.get_patterns(category, subcategory, file_type)
+        ]
+    
+    def build_hyperscan_db(self, file_type: Optional[str] = None):
+        """
+        Build a Hyperscan database with every pattern for a file type.
+        Patterns are compiled in prefilter mode, so lookarounds are approximated
+        and each hit is confirmed with the regular compiled pattern.
+        """
+        # A pattern that does not compile would fail the whole database
+        table = [
+            entry for entry in self._pattern_table(file_type)
+            if self._try_compile(entry[2]) is not None
+        ]
+        database = None
+        
+        if HYPERSCAN_AVAILABLE and table:
+            flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH |
+                     hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_DOTALL |
+                     hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+            try:
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=[pattern.encode('utf-8') for _, _, pattern in table],
+                    ids=list(range(len(table))),
+                    flags=[flags] * len(table)
+                )
+            except Exception as e:
+                logger.warning(f"Could not build Hyperscan database for {file_type}: {str(e)}")
+                database = None
+        
+        self._hyperscan_cache[file_type] = (database, table)
+        return database, table
+    
+    def scan_all(self, text: str, file_type: Optional[str] = None) -> List[tuple]:
+        """
+        Match every category/subcategory pattern against the text.
+        Returns (category, subcategory, start, end) tuples.
+        """
+        cached = self._hyperscan_cache.get(file_type)
+        database, table = cached if cached else self.build_hyperscan_db(file_type)
+        
+        if database is not None:
+            # One pass over the text; only run the patterns Hyperscan reported
+            hits = set()
+            database.scan(
+                text.encode('utf-8'),
+                match_event_handler=lambda pattern_id, start, end, flags, context: hits.add(pattern_id)
+            )
+            candidates = [table[i] for i in sorted(hits)]
+        else:
+            candidates = table
+        
+        results = []
+        for category, subcategory, pattern in candidates:
+            try:
+                compiled = self.compile_pattern(pattern)
+            except re.error:
+                continue
+            for match in compiled.finditer(text):
+                results.append((category, subcategory, match.start(), match.end()))
+        
+        return results
+    
+    def _category_sources(self, file_type: Optional[str] = None) -> List[tuple]:
+        """
+        Build one combined (category, source, groups, separate) alternation per category.
+        The source is None when nothing could be joined; separate lists the
+        (subcategory, compiled pattern) pairs to match on their own.
+        """
+        by_category = {}
+        for category, subcategory, pattern in self._pattern_table(file_type):
+            by_category.setdefault(category, []).append((subcategory, pattern))
+        
+        sources = []
+        for category, items in by_category.items():
+            source, groups, separate = self._checked_source(items)
+            if source is not None or separate:
+                sources.append((category, source, groups, separate))
+        return sources
+    
+    def generate_module(self, output_path: Optional[Path] = None) -> Path:
+        """
+        Write a Python module with every category alternation as a precompiled constant
+        and an extract(text, file_type) function.
+        """
+        if output_path is None:
+            output_path = self.config_path.parent / "generated_patterns.py"
+        
+        lines = [
+            "# Generated by PatternConfig.generate_module - do not edit by hand",
+            "",
+            "import re",
+            "",
+        ]
+        tables = []
+        
+        for index, file_type in enumerate([None] + self.get_file_types()):
+            entries = []
+            for category, source, groups, separate in self._category_sources(file_type):
+                name = "None"
+                if source is not None:
+                    name = f"_PAT_{index}_{len(entries)}"
+                    lines.append(f"{name} = re.compile({source!r})")
+                
+                singles = []
+                for subcategory, compiled in separate:
+                    single = f"_SEP_{index}_{len(entries)}_{len(singles)}"
+                    lines.append(f"{single} = re.compile({compiled.pattern!r}, re.MULTILINE | re.DOTALL)")
+                    singles.append(f"({subcategory!r}, {single}), ")
+                
+                entries.append(f"({category!r}, {name}, {groups!r}, ({''.join(singles)}))")
+            tables.append(f"    {file_type!r}: ({', '.join(entries)}{',' if len(entries) == 1 else ''}),")
+        
+        lines += [
+            "",
+            "_TABLES = {",
+            *tables,
+            "}",
+            "",
+            "def extract(text, file_type=None):",
+            '    """Return (category, subcategory, groups, start, end) for every match"""',
+            "    results = []",
+            "    for category, compiled, groups, separate in _TABLES.get(file_type, _TABLES[None]):",
+            "        if compiled is not None:",
+            "            for match in compiled.finditer(text):",
+            "                subcategory, first, count = groups[match.lastgroup]",
+            "                results.append((category, subcategory,",
+            "                                match.groups()[first:first + count],",
+            "                                match.start(), match.end()))",
+            "        for subcategory, single in separate:",
+            "            for match in single.finditer(text):",
+            "                results.append((category, subcategory, match.groups(),",
+            "                                match.start(), match.end()))",
+            "    return results",
+            "",
+        ]
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text("\n".join(lines), encoding='utf-8')
+        logger.info(f"Generated pattern module {output_path}")
+        return output_path
+    
+    def _load_generated(self):
+        """Generate and import the extraction module for the current patterns"""
+        try:
+            path = self.generate_module()
+            spec = importlib.util.spec_from_file_location("generated_patterns", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._generated = module
+        except Exception as e:
+            logger.error(f"Error generating pattern module: {str(e)}")
+            self._generated = None
+    
+    def extract(self, text: str, file_type: Optional[str] = None) -> List[tuple]:
+        """
+        Extract matches for all categories with one combined pass per category.
+        Returns (category, subcategory, groups, start, end) tuples.
+        """
+        if self._generated is None and self.codegen:
+            self._load_generated()
+        if self._generated is not None:
+            return self._generated.extract(text, file_type)
+        
+        key = (file_type,)
+        tables = self._combined_cache.get(key)
+        if tables is None:
+            tables = [
+                (category, re.compile(source) if source is not None else None, groups, separate)
+                for category, source, groups, separate in self._category_sources(file_type)
+            ]
+            self._combined_cache[key] = tables
+        
+        results = []
+        for category, compiled, groups, separate in tables:
+            if compiled is not None:
+                for match in compiled.finditer(text):
+                    subcategory, first, count = groups[match.lastgroup]
+                    results.append((category, subcategory,
+                                    match.groups()[first:first + count],
+                                    match.start(), match.end()))
+            
+            # Patterns that cannot share the alternation are matched one by one
+            for subcategory, single in separate:
+                for match in single.finditer(text):
+                    results.append((category, subcategory, match.groups(),
+                                    match.start(), match.end()))
+        return results
     
     def add_pattern(self, category: str, subcategory: str, pattern: str,
                    file_type: Optional[str] = None):
         """Add a new pattern"""
+        pattern = sys.intern(pattern)
         try:
             # Validate pattern by trying to compile it
-            re.compile(pattern)
+            compiled = re.compile(pattern, re.MULTILINE | re.DOTALL)
             
-            if file_type:
-                # Add file type specific pattern
-                if file_type not in self.file_type_patterns:
-                    self.file_type_patterns[file_type] = {}
-                if category not in self.file_type_patterns[file_type]:
-                    self.file_type_patterns[file_type][category] = {}
-                if subcategory not in self.file_type_patterns[file_type][category]:
-                    self.file_type_patterns[file_type][category][subcategory] = {
-                        "patterns": []
-                    }
-                
-                self.file_type_patterns[file_type][category][subcategory]["patterns"].append(pattern)
-            else:
-                # Add base pattern
-                if category not in self.patterns:
-                    self.patterns[category] = {}
-                if subcategory not in self.patterns[category]:
-                    self.patterns[category][subcategory] = {
-                        "patterns": [],
-                        "validation": None,
-                        "priority": "low"
-                    }
-                
-                self.patterns[category][subcategory]["patterns"].append(pattern)
+            with self._data_lock:
+                if file_type:
+                    # Add file type specific pattern
+                    if file_type not in self.file_type_patterns:
+                        self.file_type_patterns[file_type] = {}
+                    if category not in self.file_type_patterns[file_type]:
+                        self.file_type_patterns[file_type][category] = {}
+                    if subcategory not in self.file_type_patterns[file_type][category]:
+                        self.file_type_patterns[file_type][category][subcategory] = {
+                            "patterns": []
+                        }
+                    
+                    self.file_type_patterns[file_type][category][subcategory]["patterns"].append(pattern)
+                else:
+                    # Add base pattern
+                    if category not in self.patterns:
+                        self.patterns[category] = {}
+                    if subcategory not in self.patterns[category]:
+                        self.patterns[category][subcategory] = {
+                            "patterns": [],
+                            "validation": None,
+                            "priority": "low"
+                        }
+                    
+                    self.patterns[category][subcategory]["patterns"].append(pattern)
             
-            # Clear cache for this pattern
-            self._pattern_cache.clear()
+            # Add the compiled pattern to the cache
+            self._pattern_cache[pattern] = compiled
+            self._clear_combined()
+            self._resolve_all()
             
             # Save updated patterns
-            self.save_patterns()
+            self._schedule_save()
             
         except re.error as e:
             logger.error(f"Invalid pattern '{pattern}': {str(e)}")
@@ -291,35 +924,47 @@ class PatternConfig:
     def remove_pattern(self, category: str, subcategory: str, pattern: str,
                       file_type: Optional[str] = None):
         """Remove a pattern"""
-        if file_type:
-            if (file_type in self.file_type_patterns and
-                category in self.file_type_patterns[file_type] and
-                subcategory in self.file_type_patterns[file_type][category] and
-                "patterns" in self.file_type_patterns[file_type][category][subcategory]):
-                patterns = self.file_type_patterns[file_type][category][subcategory]["patterns"]
-                if pattern in patterns:
-                    patterns.remove(pattern)
-                    self._pattern_cache.clear()
-                    self.save_patterns()
-        else:
-            if (category in self.patterns and
-                subcategory in self.patterns[category] and
-                "patterns" in self.patterns[category][subcategory]):
-                patterns = self.patterns[category][subcategory]["patterns"]
-                if pattern in patterns:
-                    patterns.remove(pattern)
-                    self._pattern_cache.clear()
-                    self.save_patterns()
+        pattern = sys.intern(pattern)
+        removed = False
+        with self._data_lock:
+            if file_type:
+                if (file_type in self.file_type_patterns and
+                    category in self.file_type_patterns[file_type] and
+                    subcategory in self.file_type_patterns[file_type][category] and
+                    "patterns" in self.file_type_patterns[file_type][category][subcategory]):
+                    patterns = self.file_type_patterns[file_type][category][subcategory]["patterns"]
+                    if pattern in patterns:
+                        patterns.remove(pattern)
+                        self._discard_compiled(pattern)
+                        removed = True
+            else:
+                if (category in self.patterns and
+                    subcategory in self.patterns[category] and
+                    "patterns" in self.patterns[category][subcategory]):
+                    patterns = self.patterns[category][subcategory]["patterns"]
+                    if pattern in patterns:
+                        patterns.remove(pattern)
+                        self._discard_compiled(pattern)
+                        removed = True
+        
+        if removed:
+            self._schedule_save()
+    
+    def _discard_compiled(self, pattern: str):
+        """Drop a pattern from the cache unless it is still used elsewhere"""
+        self._clear_combined()
+        if pattern not in self._iter_patterns():
+            self._pattern_cache.pop(pattern, None)
+        self._resolve_all()
     
     def validate_value(self, category: str, subcategory: str, value: str) -> bool:
         """Validate a value using the appropriate validation pattern"""
-        validation_pattern = self.get_validation_pattern(category, subcategory)
-        if validation_pattern:
-            try:
-                return bool(re.match(validation_pattern, value))
-            except re.error:
-                return False
-        return True
+        entry = self._resolve(category, subcategory)
+        if entry.validator is not None:
+            return bool(entry.validator.match(value))
+        
+        # An invalid validation pattern always rejects the value
+        return not entry.validation
     
     def get_all_categories(self) -> List[str]:
         """Get list of all available categories"""
@@ -348,6 +993,12 @@ class PatternConfig:
     def get_pattern_info(self, category: str, subcategory: str, 
                         file_type: Optional[str] = None) -> Dict[str, Any]:
         """Get detailed information about patterns for a category/subcategory"""
+        # Copy so the caller cannot modify the cached result
+        return dict(self._pattern_info_cached(category, subcategory, file_type))
+    
+    def _resolve_info(self, category: str, subcategory: str,
+                      file_type: Optional[str] = None) -> Dict[str, Any]:
+        """Build the pattern info dict for get_pattern_info"""
         info = {
             "category": category,
             "subcategory": subcategory,
@@ -390,18 +1041,18 @@ class PatternConfig:
                 result = {
                     "pattern": pattern,
                     "match_count": len(matches),
-                    "matches": []
+                    "matches": [
+                        {
+                            "full_match": match[0],
+                            # groups() in one call; groups after lastindex are left out
+                            "groups": list(match.groups()[:match.lastindex]) if match.lastindex else [],
+                            "start": match.start(),
+                            "end": match.end()
+                        }
+                        for match in matches
+                    ]
                 }
                 
-                for match in matches:
-                    match_info = {
-                        "full_match": match.group(0),
-                        "groups": [match.group(i) for i in range(1, match.lastindex + 1)] if match.lastindex else [],
-                        "start": match.start(),
-                        "end": match.end()
-                    }
-                    result["matches"].append(match_info)
-                
                 results.append(result)
                 
             except re.error as e:
@@ -422,9 +1073,8 @@ class PatternConfig:
         suggestions = []
         
         if category == "article":
-            # Look for number patterns
-            numbers = re.findall(r'\b\d+\b', text)
-            lengths = Counter(len(num) for num in numbers)
+            # Count number lengths in one pass
+            lengths = _number_lengths(text)
             
             # If we find many numbers of the same length, suggest a pattern
             for length, count in lengths.items():
@@ -443,24 +1093,15 @@ class PatternConfig:
                 )
         
         elif category == "compatibility":
-            # Look for common compatibility phrases
-            phrases = [
-                r'passar med',
-                r'fungerar tillsammans med',
-                r'kan användas med',
-                r'är kompatibel med'
-            ]
-            
-            # Find contexts around these phrases
-            for phrase in phrases:
-                contexts = re.findall(f'.{{0,30}}{phrase}.{{0,30}}', text)
-                if contexts:
+            # Look for common compatibility phrases (a plain substring check is enough)
+            for phrase in _COMPATIBILITY_PHRASES:
+                if phrase in text:
                     # Create pattern based on context
                     suggestions.append(
                         f'(?i){phrase}\s+([^\.;]+)(?:\.|\;|$)'
                     )
         
-        return list(set(suggestions))  # Remove duplicates
+        return list(dict.fromkeys(suggestions))  # Remove duplicates, keep order
 
     def export_patterns(self, export_path: Optional[Path] = None) -> Path:
         """
@@ -508,8 +1149,7 @@ class PatternConfig:
         Validates the import data before applying.
         """
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            import_data = _load_json_file(Path(import_path))
             
             # Validate import data structure
             if not isinstance(import_data, dict):
@@ -518,25 +1158,37 @@ class PatternConfig:
             if "patterns" not in import_data or "file_type_patterns" not in import_data:
                 raise ValueError("Missing required pattern sections")
             
-            # Validate all patterns by trying to compile them
+            # Validate all patterns by compiling them; the results become the new cache
+            # and patterns that are already compiled are reused
+            pattern_cache = _PatternCache()
             for category in import_data["patterns"].values():
                 for subcat in category.values():
                     if "patterns" in subcat:
                         for pattern in subcat["patterns"]:
-                            try:
-                                re.compile(pattern)
-                            except re.error as e:
-                                raise ValueError(f"Invalid pattern '{pattern}': {str(e)}")
+                            if pattern in pattern_cache:
+                                continue
+                            compiled = self._pattern_cache.get(pattern)
+                            if not isinstance(compiled, re.Pattern):
+                                try:
+                                    compiled = re.compile(pattern, re.MULTILINE | re.DOTALL)
+                                except re.error as e:
+                                    raise ValueError(f"Invalid pattern '{pattern}': {str(e)}")
+                            pattern_cache[pattern] = compiled
             
             # If validation passes, update patterns
-            self.patterns = import_data["patterns"]
-            self.file_type_patterns = import_data["file_type_patterns"]
+            with self._data_lock:
+                self.patterns = import_data["patterns"]
+                self.file_type_patterns = import_data["file_type_patterns"]
             
-            # Clear pattern cache
-            self._pattern_cache.clear()
+            # Rebuild pattern cache from the validated patterns
+            self._pattern_cache = pattern_cache
+            self._clear_combined()
+            self._compile_all()
             
-            # Save the imported patterns
-            self.save_patterns()
+            # Save the imported patterns, through flush so a pending timer save cannot race it
+            with self._save_lock:
+                self._dirty = True
+            self.flush()
             
             logger.info(f"Successfully imported patterns from {import_path}")
             
@@ -1,22 +1,35 @@
 # modules/product_explorer.py
 
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, 
-                             QTreeWidgetItem, QLabel, QLineEdit, QPushButton,
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
+                             QAbstractItemView, QLabel, QLineEdit, QPushButton,
                              QMenu, QInputDialog, QMessageBox, QTabWidget,
                              QSplitter, QFrame, QFileDialog, QSpinBox,
                              QTextEdit, QPlainTextEdit, QProgressBar, QComboBox,
                              QToolBar, QStatusBar, QHeaderView )
-from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer
-from PySide6.QtGui import QIcon, QAction, QFont, QSyntaxHighlighter, QTextCharFormat, QColor
+from PySide6.QtCore import (Qt, Signal, Slot, QSize, QTimer, QObject, QRunnable, QThreadPool,
+                            QAbstractItemModel, QSortFilterProxyModel, QModelIndex)
+from PySide6.QtGui import (QIcon, QAction, QFont, QFontDatabase, QSyntaxHighlighter, QTextCharFormat,
+                           QColor, QTextCursor, QTextDocument)
 
+import re
 import json
 import logging
 import os
+import functools
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple
 from datetime import datetime
 import shutil
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson används för att parsa JSONL-rader om det finns installerat
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Försök importera avancerad botmotor, fallback till standard om den inte finns
@@ -31,82 +44,561 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("NLP-botmotor inte tillgänglig, använder standardmotor")
 
+# Produktfiler per kategori i trädet
+_PRODUCT_FILES = {
+    "tech": "technical_specs.jsonl",
+    "compat": "compatibility.jsonl",
+    "article": "article_info.jsonl",
+    "summary": "summary.jsonl"
+}
+
+def _scan_product_dirs(products_dir: Path, cache: Dict[str, Tuple[float, Any]]
+                      ) -> Tuple[List[Tuple[str, str, Dict[str, bool]]], Dict[str, Tuple[float, Any]]]:
+    """
+    Skanna produktkatalogerna och returnera ([(product_id, katalog, filer)], ny cache).
+    Resultat återanvänds ur cachen så länge katalogens mtime är oförändrad.
+    Rör inga Qt-objekt och kan köras i en bakgrundstråd.
+    """
+    new_cache = {}
+    
+    try:
+        mtime = os.stat(products_dir).st_mtime
+    except OSError:
+        return [], new_cache
+    
+    key = str(products_dir)
+    cached = cache.get(key)
+    if cached and cached[0] == mtime:
+        names = cached[1]
+    else:
+        with os.scandir(products_dir) as entries:
+            names = [entry.name for entry in entries if entry.is_dir()]
+    new_cache[key] = (mtime, names)
+    
+    products = []
+    for product_id in names:
+        key = f"{products_dir}{os.sep}{product_id}"
+        try:
+            mtime = os.stat(key).st_mtime
+        except OSError:
+            continue
+        
+        cached = cache.get(key)
+        if cached and cached[0] == mtime:
+            files = cached[1]
+        else:
+            # Kolla vilka filer som finns för produkten med en enda katalogläsning
+            with os.scandir(key) as entries:
+                file_names = {entry.name for entry in entries if entry.is_file()}
+            files = {kind: name in file_names for kind, name in _PRODUCT_FILES.items()}
+        new_cache[key] = (mtime, files)
+        products.append((product_id, key, files))
+    
+    # Borttagna produkter följer inte med till den nya cachen
+    return products, new_cache
+
+# Kategorier i trädet: (nyckel i _PRODUCT_FILES, rubrik, typ, ikontema, reservikon)
+_CATEGORIES = (
+    ("tech", "Teknisk Data", "Teknisk", "applications-system", ":/icons/tech.png"),
+    ("compat", "Kompatibilitet", "Kompatibilitet", "network-wired", ":/icons/compat.png"),
+    ("article", "Artikeldata", "Artikel", "text-x-generic", ":/icons/article.png"),
+    ("summary", "Sammanfattningar", "Sammanfattning", "help-about", ":/icons/summary.png")
+)
+
+# Förhandsgranskningskommandon i rullistan: (etikett, kommando), och kommandots index i listan
+_PREVIEW_COMMANDS = (
+    ("Tekniska detaljer (-t)", "-t"),
+    ("Kompatibilitet (-c)", "-c"),
+    ("Sammanfattning (-s)", "-s"),
+    ("Fullständig info (-f)", "-f")
+)
+_PREVIEW_COMMAND_INDEX = {command: i for i, (_, command) in enumerate(_PREVIEW_COMMANDS)}
+
+# Förvalt förhandsgranskningskommando per filnamn
+_FILENAME_TO_COMMAND = {
+    "technical_specs.jsonl": "-t",
+    "compatibility.jsonl": "-c",
+    "summary.jsonl": "-s"
+}
+
+# Typ-kolumnens text per filnamn
+_FILENAME_TO_TYPE = {_PRODUCT_FILES[key]: type_name for key, _, type_name, _, _ in _CATEGORIES}
+
+# Antal samtidiga filkopieringar vid export av en kategori
+_COPY_WORKERS = 4
+
+# Max antal sparade förhandsgranskningar (kommando, produkt, filversion)
+_PREVIEW_CACHE_SIZE = 128
+
+def _loads(line: Union[str, bytes]) -> Any:
+    """Parsa en JSON-rad, med orjson när det finns installerat"""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # T.ex. NaN eller heltal över 64 bitar, låt json avgöra
+    return json.loads(line)
+
+def _dumps_indented(data: Any) -> bytes:
+    """Serialisera till UTF-8 med indrag på två steg, med orjson när det finns installerat"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # T.ex. nycklar som inte är strängar
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+@functools.lru_cache(maxsize=None)
+def _mono_font() -> QFont:
+    """Editorns monospace-font; fontdatabasen frågas bara en gång (kräver QApplication)"""
+    return QFont("Consolas", 10) if "Consolas" in QFontDatabase.families() else QFont("Monospace", 10)
+
+def _iter_lines(text: Union[str, bytes]):
+    """Generera (radindex, rad) som split('\\n') men utan att bygga hela listan"""
+    newline = "\n" if isinstance(text, str) else b"\n"
+    find = text.find
+    start = 0
+    i = 0
+    while True:
+        end = find(newline, start)
+        if end < 0:
+            yield i, text[start:]
+            return
+        yield i, text[start:end]
+        start = end + 1
+        i += 1
+
+def _first_invalid_line(data: Union[str, bytes]) -> Optional[Tuple[int, str, Union[str, bytes]]]:
+    """Returnera (radnummer, fel, rad) för första ogiltiga JSONL-raden, eller None"""
+    for i, line in _iter_lines(data):
+        # isspace() kopierar inte raden som strip() gör
+        if line and not line.isspace():
+            try:
+                _loads(line)
+            except json.JSONDecodeError as e:
+                return i + 1, str(e), line
+    return None
+
+def _copy_head(src_path: Union[str, Path], dst, length: int) -> bool:
+    """Kopiera de första length byten från src_path till dst i kärnan, om det går"""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        with open(src_path, 'rb') as src:
+            copied = 0
+            while copied < length:
+                n = os.copy_file_range(src.fileno(), dst.fileno(), length - copied,
+                                       copied, copied)
+                if n == 0:
+                    return False
+                copied += n
+    except OSError:
+        return False
+    return True
+
+def _atomic_write(path: Union[str, Path], data: bytes, head: int = 0) -> os.stat_result:
+    """
+    Skriv till en temporär fil bredvid målet och byt in den med os.replace.
+    De första head byten är oförändrade och kopieras från den befintliga filen
+    när det går; annars skrivs hela data.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            start = head if head and _copy_head(path, f, head) else 0
+            f.seek(start)
+            f.write(memoryview(data)[start:])
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return os.stat(path)
+
+def _line_offsets(buf: bytes) -> List[int]:
+    """Startoffset för varje rad i en JSONL-buffert (en sekventiell genomläsning)"""
+    offsets = [0]
+    find = buf.find
+    pos = find(b"\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = find(b"\n", pos + 1)
+    return offsets
+
+def _first_changed_offset(old: bytes, old_offsets: List[int], new: bytes) -> int:
+    """Byteoffset för första raden som skiljer sig mellan gammal och ny buffert"""
+    for i, start in enumerate(old_offsets):
+        end = old_offsets[i + 1] if i + 1 < len(old_offsets) else len(old)
+        if new[start:end] != old[start:end]:
+            return start
+    return len(old)
+
+class _ProductScanSignals(QObject):
+    """Signaler från bakgrundsjobbet som skannar produktkatalogerna"""
+    finished = Signal(int, object)  # generation, (produkter, cache)
+    failed = Signal(int, str)       # generation, felmeddelande
+
+class _ProductScanJob(QRunnable):
+    """Skannar produktkatalogerna i en bakgrundstråd"""
+    
+    def __init__(self, products_dir: Path, cache: Dict[str, Tuple[float, Any]], generation: int):
+        super().__init__()
+        self.products_dir = products_dir
+        self.cache = cache
+        self.generation = generation
+        self.signals = _ProductScanSignals()
+    
+    def run(self):
+        try:
+            result = _scan_product_dirs(self.products_dir, self.cache)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, result)
+
+def _write_jsonl_array(out, path: Path):
+    """Strömma JSONL-raderna i path som en JSON-array, utan att bygga en lista av objekt"""
+    out.write(b"[")
+    first = True
+    if path.exists():
+        with open(path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                _loads(line)  # Validera raden; exportfilen ska alltid vara giltig JSON
+                out.write(b"\n    " if first else b",\n    ")
+                out.write(line)
+                first = False
+    out.write(b"]" if first else b"\n  ]")
+
+def _prefetch(paths: List[Path]):
+    """Be kärnan läsa in filerna i förväg, så att läsningarna överlappar (där posix_fadvise finns)"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue  # Saknade filer hoppas över som vanligt vid exporten
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+def _export_product(product_dir: Path, product_id: str, export_path: str):
+    """Samla all data för en produkt och skriv den som en JSON-fil"""
+    _prefetch([product_dir / name for name in _PRODUCT_FILES.values()])
+    
+    # Raderna skrivs direkt till en temporär fil som byts in när allt har lyckats
+    tmp_path = f"{export_path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as out:
+            out.write(b'{\n  "product_id": ' + json.dumps(product_id, ensure_ascii=False).encode('utf-8'))
+            out.write(b',\n  "exported_at": ' + json.dumps(datetime.now().isoformat()).encode('utf-8'))
+            
+            # Tekniska specifikationer, kompatibilitetsinformation och artikeldata
+            for key in ("technical_specs", "compatibility", "article_info"):
+                out.write(f',\n  "{key}": '.encode('utf-8'))
+                _write_jsonl_array(out, product_dir / f"{key}.jsonl")
+            
+            # Sammanfattning (första raden)
+            summary = {}
+            summary_path = product_dir / "summary.jsonl"
+            if summary_path.exists():
+                # Filen är liten; en läsning och en sökning efter första radbrytningen
+                buf = summary_path.read_bytes()
+                newline = buf.find(b"\n")
+                first_line = (buf if newline < 0 else buf[:newline]).strip()
+                if first_line:
+                    summary = _loads(first_line)
+            out.write(b',\n  "summary": ' + _dumps_indented(summary).replace(b"\n", b"\n  "))
+            out.write(b"\n}")
+        os.replace(tmp_path, export_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class _ProductExportSignals(QObject):
+    """Signaler från bakgrundsjobbet som exporterar en produkt"""
+    finished = Signal(str, str)  # produkt-ID, exportsökväg
+    failed = Signal(str, str)    # produkt-ID, felmeddelande
+
+class _ProductExportJob(QRunnable):
+    """Exporterar en produkts data i en bakgrundstråd"""
+    
+    def __init__(self, product_dir: Path, product_id: str, export_path: str):
+        super().__init__()
+        self.product_dir = product_dir
+        self.product_id = product_id
+        self.export_path = export_path
+        self.signals = _ProductExportSignals()
+    
+    def run(self):
+        try:
+            _export_product(self.product_dir, self.product_id, self.export_path)
+        except Exception as e:
+            self.signals.failed.emit(self.product_id, str(e))
+            return
+        self.signals.finished.emit(self.product_id, self.export_path)
+
+def _copy_files(pairs: List[Tuple[str, str]]) -> int:
+    """Kopiera (källa, mål)-par parallellt; copy2 kopierar i kärnan (sendfile) där det går"""
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as pool:
+        for _ in pool.map(lambda pair: shutil.copy2(*pair), pairs):
+            pass
+    return len(pairs)
+
+class _FileCopySignals(QObject):
+    """Signaler från bakgrundsjobbet som kopierar exportfiler"""
+    finished = Signal(int, str)  # antal filer, målmapp
+    failed = Signal(str)         # felmeddelande
+
+class _FileCopyJob(QRunnable):
+    """Kopierar en kategoris filer till exportmappen i en bakgrundstråd"""
+    
+    def __init__(self, pairs: List[Tuple[str, str]], export_dir: str):
+        super().__init__()
+        self.pairs = pairs
+        self.export_dir = export_dir
+        self.signals = _FileCopySignals()
+    
+    def run(self):
+        try:
+            count = _copy_files(self.pairs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(count, self.export_dir)
+
+# Blocktillstånd för block som markerats i efterhand (se JsonlEditor._highlight_visible_blocks)
+_BLOCK_HIGHLIGHTED = 1
+
+# Roll med förberäknat gement produkt-ID för filtrering
+_SEARCH_ROLE = Qt.UserRole + 1
+
+class _ProductTreeModel(QAbstractItemModel):
+    """
+    Produktträdet lagrat som parallella listor (en post per produkt) i stället för items per rad.
+    Kategorirader har internalId 0 och produktrader kategorins nummer + 1;
+    texter och sökvägar skapas först när vyn frågar efter dem.
+    """
+    
+    _HEADERS = ("Produkt", "Typ")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._base_dir = ""
+        self._ids: List[str] = []
+        self._lower_ids: List[str] = []
+        # En bit per kategori som produkten har en fil i
+        self._mask = array('B')
+        # Rad i kategorin -> produktnummer, stigande
+        self._rows = [array('I') for _ in _CATEGORIES]
+        self._id_index: Dict[str, int] = {}
+        self._icons = [QIcon.fromTheme(theme, QIcon(fallback)) for _, _, _, theme, fallback in _CATEGORIES]
+    
+    def set_products(self, products_dir: Path, products: List[Tuple[str, str, Dict[str, bool]]]):
+        """Ersätt innehållet med ett skanningsresultat (en modellåterställning)"""
+        self.beginResetModel()
+        self._base_dir = str(products_dir)
+        self._ids = [product_id for product_id, _, _ in products]
+        self._lower_ids = [product_id.lower() for product_id in self._ids]
+        self._mask = array('B')
+        self._rows = [array('I') for _ in _CATEGORIES]
+        for product, (_, _, files) in enumerate(products):
+            mask = 0
+            for category, (kind, *_) in enumerate(_CATEGORIES):
+                if files[kind]:
+                    mask |= 1 << category
+                    self._rows[category].append(product)
+            self._mask.append(mask)
+        self._id_index = {}
+        for product, product_id in enumerate(self._ids):
+            self._id_index.setdefault(product_id, product)
+        self.endResetModel()
+    
+    def product_count(self) -> int:
+        """Antal produkter i modellen"""
+        return len(self._ids)
+    
+    def product_index(self, product_id: str) -> QModelIndex:
+        """Index för produktens första rad (i kategoriordning), eller ogiltigt index"""
+        product = self._id_index.get(product_id)
+        if product is None:
+            return QModelIndex()
+        mask = self._mask[product]
+        for category, rows in enumerate(self._rows):
+            if mask & (1 << category):
+                return self.createIndex(bisect_left(rows, product), 0, category + 1)
+        return QModelIndex()
+    
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+    
+    def parent(self, index: QModelIndex = None):
+        if index is None:
+            return super().parent()  # QObject.parent()
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(_CATEGORIES) if self._ids else 0
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self._rows[parent.row()])
+        return 0
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        category = index.internalId()
+        column = index.column()
+        
+        if category == 0:
+            # Kategorirad
+            if column == 0:
+                if role == Qt.DisplayRole:
+                    return _CATEGORIES[index.row()][1]
+                if role == Qt.DecorationRole:
+                    return self._icons[index.row()]
+            return None
+        
+        kind, _, file_type, _, _ = _CATEGORIES[category - 1]
+        product = self._rows[category - 1][index.row()]
+        if role == Qt.DisplayRole:
+            return self._ids[product] if column == 0 else file_type
+        if column == 0:
+            if role == _SEARCH_ROLE:
+                return self._lower_ids[product]
+            if role == Qt.UserRole:
+                return f"{self._base_dir}{os.sep}{self._ids[product]}{os.sep}{_PRODUCT_FILES[kind]}"
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._HEADERS[section]
+        return None
+
+class _ProductFilterProxy(QSortFilterProxyModel):
+    """
+    Filtrerar produktträdet på produkt-ID i Qt:s C++-implementation.
+    Kategorier visas bara om någon produkt under dem matchar (rekursiv filtrering).
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterKeyColumn(0)
+        # ID:t är redan gement, så jämförelsen behöver inte vika skiftläge
+        self.setFilterRole(_SEARCH_ROLE)
+        self.setFilterCaseSensitivity(Qt.CaseSensitive)
+        self.setRecursiveFilteringEnabled(True)
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not source_parent.isValid():
+            # Kategorinamn ska inte matcha själva, men alla visas utan filter
+            return not self.filterRegularExpression().pattern()
+        return super().filterAcceptsRow(source_row, source_parent)
+
 class JsonlHighlighter(QSyntaxHighlighter):
     """Syntaxmarkering för JSONL-filer"""
     
+    # En enda genomläsning per block: varje alternativ är en tokentyp, strängar följer
+    # escape-sekvenser och en sträng följd av kolon är en nyckel
+    _TOKEN_RE = re.compile(r"""
+        (?P<key>"[^"\\]*(?:\\.[^"\\]*)*"\s*:)
+      | (?P<string>"[^"\\]*(?:\\.[^"\\]*)*"?)
+      | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+      | (?P<boolean>\b(?:true|false)\b)
+      | (?P<null>\bnull\b)
+      | (?P<bracket>[\[\]{}])
+    """, re.VERBOSE | re.IGNORECASE)
+    
+    @classmethod
+    def _build_formats(cls):
+        """Skapa formateringarna en gång; alla instanser delar samma objekt"""
+        # Definiera formateringar för olika syntaxdelar
+        cls.json_format = QTextCharFormat()
+        cls.json_format.setForeground(QColor("#2980b9"))  # Blå
+        
+        cls.key_format = QTextCharFormat()
+        cls.key_format.setForeground(QColor("#c0392b"))  # Röd
+        cls.key_format.setFontWeight(QFont.Bold)
+        
+        cls.string_format = QTextCharFormat()
+        cls.string_format.setForeground(QColor("#27ae60"))  # Grön
+        
+        cls.number_format = QTextCharFormat()
+        cls.number_format.setForeground(QColor("#8e44ad"))  # Lila
+        
+        cls.boolean_format = QTextCharFormat()
+        cls.boolean_format.setForeground(QColor("#d35400"))  # Orange
+        cls.boolean_format.setFontWeight(QFont.Bold)
+        
+        cls.null_format = QTextCharFormat()
+        cls.null_format.setForeground(QColor("#7f8c8d"))  # Grå
+        cls.null_format.setFontWeight(QFont.Bold)
+        
+        cls.bracket_format = QTextCharFormat()
+        cls.bracket_format.setForeground(QColor("#34495e"))  # Mörkgrå
+        cls.bracket_format.setFontWeight(QFont.Bold)
+        
+        # Tokentyp (gruppnamn i _TOKEN_RE) -> format
+        cls._token_formats = {
+            "key": cls.key_format,
+            "string": cls.string_format,
+            "number": cls.number_format,
+            "boolean": cls.boolean_format,
+            "null": cls.null_format,
+            "bracket": cls.bracket_format
+        }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        # Definiera formateringar för olika syntaxdelar
-        self.json_format = QTextCharFormat()
-        self.json_format.setForeground(QColor("#2980b9"))  # Blå
-        
-        self.key_format = QTextCharFormat()
-        self.key_format.setForeground(QColor("#c0392b"))  # Röd
-        self.key_format.setFontWeight(QFont.Bold)
-        
-        self.string_format = QTextCharFormat()
-        self.string_format.setForeground(QColor("#27ae60"))  # Grön
-        
-        self.number_format = QTextCharFormat()
-        self.number_format.setForeground(QColor("#8e44ad"))  # Lila
-        
-        self.boolean_format = QTextCharFormat()
-        self.boolean_format.setForeground(QColor("#d35400"))  # Orange
-        self.boolean_format.setFontWeight(QFont.Bold)
+        if not hasattr(JsonlHighlighter, "_token_formats"):
+            JsonlHighlighter._build_formats()
         
-        self.null_format = QTextCharFormat()
-        self.null_format.setForeground(QColor("#7f8c8d"))  # Grå
-        self.null_format.setFontWeight(QFont.Bold)
-        
-        self.bracket_format = QTextCharFormat()
-        self.bracket_format.setForeground(QColor("#34495e"))  # Mörkgrå
-        self.bracket_format.setFontWeight(QFont.Bold)
+        # När hela dokumentet byts ut hoppas markeringen över; synliga block markeras sedan av editorn
+        self.deferred = False
 
     def highlightBlock(self, text):
-        """Markera JSON-syntax"""
-        import re
-        
-        # Markera nycklar - "key":
-        for match in re.finditer(r'"([^"]+)"\s*:', text):
-            self.setFormat(match.start(), match.end() - match.start(), self.key_format)
-        
-        # Markera strängar - "value"
-        for match in re.finditer(r':\s*"([^"]*)"', text):
-            value_start = match.start(1) - 1
-            value_len = len(match.group(1)) + 2  # +2 för citattecken
-            self.setFormat(value_start, value_len, self.string_format)
-        
-        # Markera strängar utan föregående kolon (t.ex. i arrayer)
-        for match in re.finditer(r'(?<!:)\s*"([^"]*)"', text):
-            # Undvik att markera nycklar igen
-            if not re.search(r'"[^"]+"\s*:', match.group(0)):
-                self.setFormat(match.start(), match.end() - match.start(), self.string_format)
-        
-        # Markera nummer
-        for match in re.finditer(r':\s*(-?\d+(?:\.\d+)?)', text):
-            self.setFormat(match.start(1), match.end(1) - match.start(1), self.number_format)
-        
-        # Markera booleska värden
-        for match in re.finditer(r':\s*(true|false)', text, re.IGNORECASE):
-            self.setFormat(match.start(1), match.end(1) - match.start(1), self.boolean_format)
-        
-        # Markera null
-        for match in re.finditer(r':\s*(null)', text, re.IGNORECASE):
-            self.setFormat(match.start(1), match.end(1) - match.start(1), self.null_format)
-        
-        # Markera hakparenteser och klammerparenteser
-        for match in re.finditer(r'[[\]{}]', text):
-            self.setFormat(match.start(), 1, self.bracket_format)
+        """Markera JSON-syntax i en genomläsning"""
+        if self.deferred:
+            return
+        formats = self._token_formats
+        set_format = self.setFormat
+        for match in self._TOKEN_RE.finditer(text):
+            start = match.start()
+            set_format(start, match.end() - start, formats[match.lastgroup])
 
 class JsonlEditor(QWidget):
     """Editor för JSONL-filer med syntaxmarkering och avancerade funktioner"""
     
-    data_changed = Signal(str)  # Signal när data ändras
+    data_changed = Signal()  # Signal när editorn har sparat current_file
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_file = None
+        # Innehåll och radindex för filen som laddades, används för att bara skriva om ändrade rader
+        self._loaded_data = b""
+        self._line_index: List[int] = [0]
+        self._loaded_stat: Optional[Tuple[int, int]] = None
+        # hash() av senast validerade text; nollställs vid varje ändring i editorn
+        self._validated_hash: Optional[int] = None
         self.init_ui()
         
     def init_ui(self):
@@ -153,12 +645,12 @@ class JsonlEditor(QWidget):
         self.editor.setLineWrapMode(QPlainTextEdit.NoWrap)
         
         # Använd monospace-font för bättre läsbarhet
-        available_fonts = QFont().families()  # Anropa families() på en instans av QFont
-        font = QFont("Consolas", 10) if "Consolas" in available_fonts else QFont("Monospace", 10)
-        self.editor.setFont(font)
+        self.editor.setFont(_mono_font())
         
         # Aktivera radnummer och syntaxmarkering
         self.highlighter = JsonlHighlighter(self.editor.document())
+        self.editor.updateRequest.connect(self._highlight_visible_blocks)
+        self.editor.textChanged.connect(self._clear_validated)
         
         # Lägg till editor i layouten
         layout.addWidget(self.editor)
@@ -175,9 +667,12 @@ class JsonlEditor(QWidget):
         """Ladda en JSONL-fil och visa i editorn"""
         try:
             self.current_file = file_path
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            self.editor.setPlainText(text)
+            # Obuffrad läsning: hela filen läses direkt till ett bytes-objekt och avkodas en gång
+            with open(file_path, 'rb', buffering=0) as f:
+                data = f.read()
+                st = os.fstat(f.fileno())
+            self._remember_contents(data, st)
+            self._set_text(data.decode('utf-8'))
             self.status_bar.showMessage(f"Laddade {file_path.name}")
             
             # Uppdatera fönsterrubrik med filnamn
@@ -187,6 +682,30 @@ class JsonlEditor(QWidget):
             QMessageBox.warning(self, "Fel", f"Kunde inte ladda fil: {str(e)}")
             self.status_bar.showMessage("Fel vid laddning av fil")
     
+    def _set_text(self, text: str):
+        """Byt hela texten utan att markera varje block; bara synliga block markeras"""
+        self.highlighter.deferred = True
+        try:
+            self.editor.setPlainText(text)
+        finally:
+            self.highlighter.deferred = False
+        self._highlight_visible_blocks()
+    
+    def _highlight_visible_blocks(self, *args):
+        """Markera synliga block som hoppades över när texten byttes ut"""
+        if self.highlighter.deferred:
+            return  # updateRequest kan komma mitt i setPlainText
+        editor = self.editor
+        bottom = editor.viewport().height()
+        offset = editor.contentOffset()
+        block = editor.firstVisibleBlock()
+        while block.isValid() and editor.blockBoundingGeometry(block).translated(offset).top() <= bottom:
+            if block.userState() != _BLOCK_HIGHLIGHTED:
+                # Tillståndet sätts före omarkeringen så att den inte sprider sig till nästa block
+                block.setUserState(_BLOCK_HIGHLIGHTED)
+                self.highlighter.rehighlightBlock(block)
+            block = block.next()
+    
     def save_data(self):
         """Spara ändringar till fil"""
         if not self.current_file:
@@ -194,22 +713,54 @@ class JsonlEditor(QWidget):
             return
         
         try:
-            # Validera först
-            if not self.validate_json():
-                return
+            # Texten hämtas och kodas en gång; samma buffert valideras och skrivs
+            text = self.editor.toPlainText()
+            data = text.encode('utf-8')
+            text_hash = hash(text)
+            if text_hash != self._validated_hash:
+                invalid = _first_invalid_line(data)
+                if invalid:
+                    self._show_invalid_line(*invalid)
+                    return
+                self._validated_hash = text_hash
             
-            # Spara till fil
-            with open(self.current_file, 'w', encoding='utf-8') as f:
-                f.write(self.editor.toPlainText())
+            # Spara till fil, bara från första ändrade raden och framåt
+            self._write_changes(data)
                 
-            # Signalera att data har ändrats
-            self.data_changed.emit(self.editor.toPlainText())
+            # Signalera att filen har sparats
+            self.data_changed.emit()
             self.status_bar.showMessage(f"Sparad: {self.current_file.name}")
             
         except Exception as e:
             QMessageBox.warning(self, "Fel", f"Kunde inte spara: {str(e)}")
             self.status_bar.showMessage(f"Fel vid sparning: {str(e)}")
     
+    def _remember_contents(self, data: bytes, st: os.stat_result):
+        """Spara filens innehåll och radindex som jämförelsebas"""
+        self._loaded_data = data
+        self._line_index = _line_offsets(data)
+        self._loaded_stat = (st.st_size, st.st_mtime_ns)
+    
+    def _write_changes(self, data: bytes):
+        """
+        Skriv filen atomiskt via en temporär fil. Oförändrade rader i början
+        kopieras från filen på disk om den inte ändrats sedan den laddades.
+        """
+        try:
+            st = os.stat(self.current_file)
+            unchanged_on_disk = (st.st_size, st.st_mtime_ns) == self._loaded_stat
+        except OSError:
+            unchanged_on_disk = False
+        
+        head = 0
+        if unchanged_on_disk:
+            if data == self._loaded_data:
+                return
+            head = _first_changed_offset(self._loaded_data, self._line_index, data)
+        st = _atomic_write(self.current_file, data, head)
+        
+        self._remember_contents(data, st)
+    
     def format_json(self):
         """Formattera JSONL för bättre läsbarhet"""
         try:
@@ -217,13 +768,11 @@ class JsonlEditor(QWidget):
             formatted_lines = []
             
             # Bearbeta rad för rad
-            for i, line in enumerate(text.split('\n')):
+            for i, line in _iter_lines(text):
                 if line.strip():
                     try:
                         # Parse och formattera varje JSON-objekt
-                        data = json.loads(line)
-                        # Skapa en snygg indenterad version
-                        formatted = json.dumps(data, ensure_ascii=False, indent=2)
+                        data = _loads(line)
                         # Konvertera till en rad igen
                         formatted_line = json.dumps(data, ensure_ascii=False)
                         formatted_lines.append(formatted_line)
@@ -236,7 +785,10 @@ class JsonlEditor(QWidget):
                         )
                         return
             
-            self.editor.setPlainText('\n'.join(formatted_lines))
+            formatted = '\n'.join(formatted_lines)
+            self._set_text(formatted)
+            # Varje rad har just parsats, så texten behöver inte valideras igen vid sparning
+            self._validated_hash = hash(formatted)
             self.status_bar.showMessage("JSON formaterad")
             
         except Exception as e:
@@ -246,45 +798,37 @@ class JsonlEditor(QWidget):
     def validate_json(self) -> bool:
         """Validera JSONL-syntax, rad för rad"""
         text = self.editor.toPlainText()
-        valid = True
-        
-        for i, line in enumerate(text.split('\n')):
-            if line.strip():
-                try:
-                    json.loads(line)
-                except json.JSONDecodeError as e:
-                    QMessageBox.warning(
-                        self, 
-                        "Valideringsfel", 
-                        f"Fel på rad {i+1}: {str(e)}\n\nRad: {line[:50]}..."
-                    )
-                    # Markera raden med felet
-                    cursor = self.editor.textCursor()
-                    cursor.movePosition(cursor.Start)
-                    for _ in range(i):
-                        cursor.movePosition(cursor.Down)
-                    cursor.movePosition(cursor.EndOfLine, cursor.KeepAnchor)
-                    self.editor.setTextCursor(cursor)
-                    valid = False
-                    break
-        
-        if valid:
-            self.status_bar.showMessage("JSON validerad - OK")
-        
-        return valid
+        invalid = _first_invalid_line(text)
+        if invalid:
+            self._show_invalid_line(*invalid)
+            return False
+        
+        self._validated_hash = hash(text)
+        self.status_bar.showMessage("JSON validerad - OK")
+        return True
+    
+    def _clear_validated(self):
+        """Texten har ändrats; tidigare validering gäller inte längre"""
+        self._validated_hash = None
+    
+    def _show_invalid_line(self, line_no: int, error: str, line: Union[str, bytes]):
+        """Visa valideringsfelet och markera raden i editorn"""
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        QMessageBox.warning(
+            self, 
+            "Valideringsfel", 
+            f"Fel på rad {line_no}: {error}\n\nRad: {line[:50]}..."
+        )
+        # Markera raden med felet
+        block = self.editor.document().findBlockByNumber(line_no - 1)
+        cursor = QTextCursor(block)
+        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
     
     def find_text(self):
         """Sök efter text i editorn"""
-        text = self.search_input.text()
-        if not text:
-            return
-        
-        cursor = self.editor.textCursor()
-        # Starta från början om vi är i slutet
-        if cursor.atEnd():
-            cursor.movePosition(cursor.Start)
-            self.editor.setTextCursor(cursor)
-        
+        # find_next börjar själv om från början när den når slutet
         self.find_next()
     
     def find_next(self):
@@ -293,16 +837,15 @@ class JsonlEditor(QWidget):
         if not text:
             return
         
-        # Sök med hänsyn till skiftläge
-        options = QTextEdit.FindCaseSensitively
-        found = self.editor.find(text, options)
-        
-        if not found:
+        # Sök i dokumentet direkt så att vyn bara uppdateras en gång vid träff
+        doc = self.editor.document()
+        options = QTextDocument.FindCaseSensitively
+        cursor = doc.find(text, self.editor.textCursor(), options)
+        if cursor.isNull():
             # Om inte hittat, börja om från början
-            cursor = self.editor.textCursor()
-            cursor.movePosition(cursor.Start)
+            cursor = doc.find(text, 0, options)
+        if not cursor.isNull():
             self.editor.setTextCursor(cursor)
-            self.editor.find(text, options)
 
 class ProductExplorer(QWidget):
     """
@@ -334,8 +877,30 @@ class ProductExplorer(QWidget):
             # För standardmotorn
             self.integrated_dir = Path(config.get("integrated_data_dir", "./integrated_data"))
         
-        # Initiera botmotor
-        self.init_bot_engine()
+        # Cache för katalogskanning: sökväg -> (mtime, innehåll)
+        self._product_cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # Skanningen körs i bakgrunden; generationen avgör vilket resultat som gäller
+        self._scan_pool = QThreadPool.globalInstance()
+        self._scan_generation = 0
+        
+        # Botsvar cachas per (kommando, produkt, filversion); en ändrad fil ger en ny nyckel.
+        # Anropet väljs en gång efter motortyp
+        run_command = self._run_nlp_command if NLP_AVAILABLE else self._run_engine_command
+        self._preview_cache = functools.lru_cache(maxsize=_PREVIEW_CACHE_SIZE)(run_command)
+        
+        # Kontextmenyerna byggs vid första högerklick och återanvänds
+        self._category_menu: Optional[QMenu] = None
+        self._product_menu: Optional[QMenu] = None
+        self._ctx_current_index = QModelIndex()
+        
+        # Sökfiltret körs först när användaren slutat skriva
+        self._pending_filter = ""
+        self._applied_filter = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
         
         # Initiera UI
         self.init_ui()
@@ -343,18 +908,30 @@ class ProductExplorer(QWidget):
         # Ladda produktdata
         self.load_products()
     
+    @functools.cached_property
+    def bot_engine(self):
+        """Botmotorn skapas först när ett kommando körs"""
+        return self.init_bot_engine()
+    
     def init_bot_engine(self):
         """Initiera botmotor baserat på tillgänglighet"""
         try:
             if NLP_AVAILABLE:
-                self.bot_engine = AdvancedBotEngine(self.config)
+                engine = AdvancedBotEngine(self.config)
                 logger.info("NLP-botmotor initierad i ProductExplorer")
             else:
-                self.bot_engine = BotEngine(self.config)
+                engine = BotEngine(self.config)
                 logger.info("Standardbotmotor initierad i ProductExplorer")
+            return engine
         except Exception as e:
             logger.error(f"Fel vid initiering av botmotor: {str(e)}")
             QMessageBox.warning(self, "Motorfel", f"Kunde inte initiera botmotor: {str(e)}")
+            raise
+    
+    def reset_bot_engine(self):
+        """Släpp botmotorn och cachade svar, t.ex. efter ändrad konfiguration"""
+        self.__dict__.pop("bot_engine", None)
+        self._preview_cache.cache_clear()
     
     def init_ui(self):
         """Initiera användargränssnittet med alla komponenter"""
@@ -400,31 +977,37 @@ class ProductExplorer(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Sök produkter...")
         self.search_input.setClearButtonEnabled(True)
-        self.search_input.textChanged.connect(self.filter_products)
+        self.search_input.textChanged.connect(self._schedule_filter)
         search_layout.addWidget(self.search_input)
         
         left_layout.addLayout(search_layout)
         
+        # Produktmodell med filterproxy framför trädvyn
+        self.product_model = _ProductTreeModel(self)
+        self.product_proxy = _ProductFilterProxy(self)
+        self.product_proxy.setSourceModel(self.product_model)
+        
         # Produktträd med förbättrad utseende
-        self.product_tree = QTreeWidget()
-        self.product_tree.setHeaderLabels(["Produkt", "Typ"])
+        self.product_tree = QTreeView()
+        self.product_tree.setModel(self.product_proxy)
+        self.product_tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.product_tree.setAlternatingRowColors(True)
         self.product_tree.setAnimated(True)
         self.product_tree.header().setStretchLastSection(False)
         self.product_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.product_tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.product_tree.doubleClicked.connect(self._on_index_double_clicked)
         self.product_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.product_tree.customContextMenuRequested.connect(self.show_context_menu)
         self.product_tree.setStyleSheet("""
-            QTreeWidget {
+            QTreeView {
                 background-color: #FAFAFA;
                 border: 1px solid #CCCCCC;
                 border-radius: 4px;
             }
-            QTreeWidget::item {
+            QTreeView::item {
                 padding: 4px;
             }
-            QTreeWidget::item:selected {
+            QTreeView::item:selected {
                 background-color: #E3F2FD;
                 color: #0D47A1;
             }
@@ -466,10 +1049,8 @@ class ProductExplorer(QWidget):
         
         # Välj kommando för preview
         self.preview_command = QComboBox()
-        self.preview_command.addItem("Tekniska detaljer (-t)", "-t")
-        self.preview_command.addItem("Kompatibilitet (-c)", "-c")
-        self.preview_command.addItem("Sammanfattning (-s)", "-s")
-        self.preview_command.addItem("Fullständig info (-f)", "-f")
+        for label, command in _PREVIEW_COMMANDS:
+            self.preview_command.addItem(label, command)
         self.preview_command.currentIndexChanged.connect(self.update_preview_for_current)
         preview_controls.addWidget(QLabel("Kommando:"))
         preview_controls.addWidget(self.preview_command)
@@ -488,8 +1069,9 @@ class ProductExplorer(QWidget):
         main_splitter.addWidget(left_panel)
         main_splitter.addWidget(right_panel)
         
-        # Sätt standardbredd på panelerna (30/70)
-        main_splitter.setSizes([int(self.width() * 0.3), int(self.width() * 0.7)])
+        # Fördela bredden 30/70 när splittern får sin storlek (bredden är inte känd än)
+        main_splitter.setStretchFactor(0, 3)
+        main_splitter.setStretchFactor(1, 7)
         
         layout.addWidget(main_splitter)
         
@@ -500,112 +1082,110 @@ class ProductExplorer(QWidget):
     
     def load_products(self):
         """Ladda produkter från integrerad data och organisera i trädvy"""
-        self.product_tree.clear()
         self.status_bar.showMessage("Laddar produkter...")
         
+        # Läs in alla produktkataloger i bakgrunden (cachat på katalogernas mtime)
+        self._scan_generation += 1
+        job = _ProductScanJob(self.integrated_dir / "products", self._product_cache, self._scan_generation)
+        job.signals.finished.connect(self._on_products_scanned, Qt.QueuedConnection)
+        job.signals.failed.connect(self._on_products_scan_failed, Qt.QueuedConnection)
+        self._scan_pool.start(job)
+    
+    @Slot(int, str)
+    def _on_products_scan_failed(self, generation: int, error: str):
+        """Rapportera ett fel från skanningsjobbet"""
+        if generation != self._scan_generation:
+            return
+        logger.error(f"Fel vid laddning av produkter: {error}")
+        QMessageBox.warning(self, "Fel", f"Kunde inte ladda produkter: {error}")
+        self.status_bar.showMessage("Fel vid laddning av produkter")
+    
+    @Slot(int, object)
+    def _on_products_scanned(self, generation: int, result: tuple):
+        """Ta emot skanningsresultatet och bygg trädet i GUI-tråden"""
+        if generation != self._scan_generation:
+            return  # En nyare skanning har startats
+        products, self._product_cache = result
+        self._populate_tree(products)
+    
+    def _populate_tree(self, products: List[Tuple[str, str, Dict[str, bool]]]):
+        """Bygg produktträdet från skanningsresultatet"""
         try:
-            # Läs in alla produktkataloger
-            product_dirs = list(self.integrated_dir.glob("products/*"))
+            # Modellen återställs i ett svep; vyn ritar om en gång
+            self.product_model.set_products(self.integrated_dir / "products", products)
             
-            if not product_dirs:
+            if not products:
                 self.status_bar.showMessage("Inga produkter hittades i " + str(self.integrated_dir))
                 return
             
-            # Skapa rot-items för olika kategorier med ikoner
-            self.tech_root = QTreeWidgetItem(self.product_tree, ["Teknisk Data"])
-            self.tech_root.setIcon(0, QIcon.fromTheme("applications-system", QIcon(":/icons/tech.png")))
-            
-            self.compat_root = QTreeWidgetItem(self.product_tree, ["Kompatibilitet"])
-            self.compat_root.setIcon(0, QIcon.fromTheme("network-wired", QIcon(":/icons/compat.png")))
-            
-            self.article_root = QTreeWidgetItem(self.product_tree, ["Artikeldata"])
-            self.article_root.setIcon(0, QIcon.fromTheme("text-x-generic", QIcon(":/icons/article.png")))
-            
-            self.summary_root = QTreeWidgetItem(self.product_tree, ["Sammanfattningar"])
-            self.summary_root.setIcon(0, QIcon.fromTheme("help-about", QIcon(":/icons/summary.png")))
-            
-            # Processa varje produktkatalog
-            for product_dir in product_dirs:
-                product_id = product_dir.name
-                
-                # Kolla vilka filer som finns för produkten
-                files = {
-                    "tech": (product_dir / "technical_specs.jsonl").exists(),
-                    "compat": (product_dir / "compatibility.jsonl").exists(),
-                    "article": (product_dir / "article_info.jsonl").exists(),
-                    "summary": (product_dir / "summary.jsonl").exists()
-                }
-                
-                # Lägg till under respektive kategori
-                if files["tech"]:
-                    item = QTreeWidgetItem(self.tech_root, [product_id, "Teknisk"])
-                    item.setData(0, Qt.UserRole, str(product_dir / "technical_specs.jsonl"))
-                
-                if files["compat"]:
-                    item = QTreeWidgetItem(self.compat_root, [product_id, "Kompatibilitet"])
-                    item.setData(0, Qt.UserRole, str(product_dir / "compatibility.jsonl"))
-                
-                if files["article"]:
-                    item = QTreeWidgetItem(self.article_root, [product_id, "Artikel"])
-                    item.setData(0, Qt.UserRole, str(product_dir / "article_info.jsonl"))
-                
-                if files["summary"]:
-                    item = QTreeWidgetItem(self.summary_root, [product_id, "Sammanfattning"])
-                    item.setData(0, Qt.UserRole, str(product_dir / "summary.jsonl"))
-            
             # Expandera alla kategorier
             self.product_tree.expandAll()
             
             # Uppdatera statusrad
-            self.status_bar.showMessage(f"Laddade {len(product_dirs)} produkter")
+            self.status_bar.showMessage(f"Laddade {len(products)} produkter")
             
         except Exception as e:
             logger.error(f"Fel vid laddning av produkter: {str(e)}")
             QMessageBox.warning(self, "Fel", f"Kunde inte ladda produkter: {str(e)}")
             self.status_bar.showMessage("Fel vid laddning av produkter")
     
+    def _source_index(self, index: QModelIndex) -> QModelIndex:
+        """Översätt ett proxyindex till modellens index i kolumn 0"""
+        return self.product_proxy.mapToSource(index).siblingAtColumn(0)
+    
+    def _selected_index(self) -> Optional[QModelIndex]:
+        """Hämta den markerade radens modellindex (kolumn 0) eller None"""
+        rows = self.product_tree.selectionModel().selectedRows(0)
+        return self._source_index(rows[0]) if rows else None
+    
+    def _index_type(self, index: QModelIndex) -> str:
+        """Hämta texten i Typ-kolumnen för en produktrad"""
+        return index.siblingAtColumn(1).data() or ""
+    
+    def _schedule_filter(self, text: str):
+        """Spara söktexten och starta om fördröjningen"""
+        self._pending_filter = text
+        self._filter_timer.start()
+    
+    def _apply_filter(self):
+        """Kör den senast inmatade söktexten"""
+        self._filter_timer.stop()
+        self.filter_products(self._pending_filter)
+    
     def filter_products(self, text: str):
         """Filtrera produkter baserat på söktext med förbättrad användarupplevelse"""
-        search_text = text.lower().strip()
+        search_text = text.strip()
+        
+        # Filtreringen görs av proxymodellen mot förberäknade gemena ID:n;
+        # filtrera bara om när mönstret faktiskt ändrats (t.ex. inte för ett blanksteg)
+        pattern = search_text.lower()
+        if pattern != self._applied_filter:
+            self._applied_filter = pattern
+            self.product_proxy.setFilterFixedString(pattern)
         
         # Om söktext är tom, visa alla produkter
         if not search_text:
-            for i in range(self.product_tree.topLevelItemCount()):
-                category = self.product_tree.topLevelItem(i)
-                category.setHidden(False)
-                for j in range(category.childCount()):
-                    category.child(j).setHidden(False)
-            
             self.status_bar.showMessage("Visar alla produkter")
             return
         
-        # Leta efter matchande produkter i trädet
-        match_count = 0
-        for i in range(self.product_tree.topLevelItemCount()):
-            category = self.product_tree.topLevelItem(i)
-            visible_children = False
-            
-            for j in range(category.childCount()):
-                item = category.child(j)
-                product_id = item.text(0).lower()
-                matches = search_text in product_id
-                item.setHidden(not matches)
-                
-                if matches:
-                    visible_children = True
-                    match_count += 1
-            
-            category.setHidden(not visible_children)
+        self.product_tree.expandAll()
         
         # Uppdatera statusrad med sökresultat
+        proxy = self.product_proxy
+        match_count = sum(proxy.rowCount(proxy.index(i, 0)) for i in range(proxy.rowCount()))
         self.status_bar.showMessage(f"Hittade {match_count} matchande produkter")
     
-    def on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_index_double_clicked(self, index: QModelIndex):
+        """Översätt dubbelklick i vyn till modellens index"""
+        if index.isValid():
+            self.on_item_double_clicked(self._source_index(index), index.column())
+    
+    def on_item_double_clicked(self, index: QModelIndex, column: int):
         """Hantera dubbelklick på en produkt i trädet"""
-        if item.parent() is None:
+        if not index.parent().isValid():
             return  # Klick på kategori, inte på produkt
         
-        file_path = item.data(0, Qt.UserRole)
+        file_path = index.data(Qt.UserRole)
         if not file_path:
             return
         
@@ -613,8 +1193,8 @@ class ProductExplorer(QWidget):
         self.jsonl_editor.load_file(Path(file_path))
         
         # Extrahera produkt-ID och filtyp
-        product_id = item.text(0)
-        file_type = item.text(1)
+        product_id = index.data()
+        file_type = self._index_type(index)
         
         # Emitta signal för produktval
         self.product_selected.emit(product_id, file_path)
@@ -625,128 +1205,138 @@ class ProductExplorer(QWidget):
         # Uppdatera statusrad
         self.status_bar.showMessage(f"Laddade {file_type}-data för produkt {product_id}")
     
-    def on_data_changed(self, data: str):
-       """Hantera ändrad data i editorn, spara och uppdatera gränssnitt"""
-       items = self.product_tree.selectedItems()
-       if not items:
+    def on_data_changed(self):
+       """Hantera sparad data i editorn och uppdatera gränssnitt"""
+       # Editorn har redan skrivit filen; här uppdateras bara resten av gränssnittet
+       file_path = self.jsonl_editor.current_file
+       if not file_path:
            return
        
-       item = items[0]
-       if item.parent() is None:
-           return  # Kategori, inte produkt
+       product_id = file_path.parent.name
+       file_type = _FILENAME_TO_TYPE.get(file_path.name, "")
+       
+       # Emitta signal om dataändring
+       self.data_modified.emit(product_id, file_type)
        
-       product_id = item.text(0)
-       file_type = item.text(1)
-       file_path = item.data(0, Qt.UserRole)
+       # Uppdatera förhandsgranskning
+       self.update_bot_preview(product_id, file_path)
        
-       if file_path:
-           try:
-               # Spara data till fil
-               with open(file_path, 'w', encoding='utf-8') as f:
-                   f.write(data)
-               
-               # Emitta signal om dataändring
-               self.data_modified.emit(product_id, file_type)
-               
-               # Uppdatera förhandsgranskning
-               self.update_bot_preview(product_id, Path(file_path))
-               
-               # Uppdatera statusrad
-               self.status_bar.showMessage(f"Sparade ändringar för {product_id} ({file_type})")
-               
-           except Exception as e:
-               logger.error(f"Fel vid sparning av data: {str(e)}")
-               QMessageBox.warning(self, "Fel", f"Kunde inte spara ändringar: {str(e)}")
-               self.status_bar.showMessage("Fel vid sparning av ändringar")
+       # Uppdatera statusrad
+       self.status_bar.showMessage(f"Sparade ändringar för {product_id} ({file_type})")
    
-    def show_context_menu(self, position):
-        
-        """Visa kontextmeny med avancerade åtgärder för valda produkter"""
-        items = self.product_tree.selectedItems()
-        if not items:
-            return
-        
-        item = items[0]
-        if item.parent() is None:
-            # Kontextmeny för kategorier
-            menu = QMenu()
-            expand_all = QAction("Expandera alla", self)
-            expand_all.triggered.connect(lambda: self.product_tree.expandAll())
-            menu.addAction(expand_all)
-            
-            collapse_all = QAction("Kollapsa alla", self)
-            collapse_all.triggered.connect(lambda: self.product_tree.collapseAll())
-            menu.addAction(collapse_all)
-            
-            menu.exec_(self.product_tree.viewport().mapToGlobal(position))
-            return
-        
-        # Kontextmeny för produkter
-        menu = QMenu()
+    def _build_category_menu(self) -> QMenu:
+        """Bygg kontextmenyn för kategorier (en gång)"""
+        menu = QMenu(self)
+        expand_all = QAction("Expandera alla", menu)
+        expand_all.triggered.connect(self.product_tree.expandAll)
+        menu.addAction(expand_all)
+        
+        collapse_all = QAction("Kollapsa alla", menu)
+        collapse_all.triggered.connect(self.product_tree.collapseAll)
+        menu.addAction(collapse_all)
+        return menu
+    
+    def _build_product_menu(self) -> QMenu:
+        """Bygg kontextmenyn för produkter (en gång); åtgärderna läser _ctx_current_index"""
+        menu = QMenu(self)
         
         # Grundläggande åtgärder
-        open_action = QAction(QIcon.fromTheme("document-open", QIcon(":/icons/open.png")), "Öppna i editor", self)
-        open_action.triggered.connect(lambda: self.on_item_double_clicked(item, 0))
+        open_action = QAction(QIcon.fromTheme("document-open", QIcon(":/icons/open.png")), "Öppna i editor", menu)
+        open_action.triggered.connect(self._ctx_open)
         menu.addAction(open_action)
         
         # Bot-kommandon undermeny
         bot_menu = menu.addMenu(QIcon.fromTheme("system-run", QIcon(":/icons/bot.png")), "Bot-kommandon")
         
-        tech_action = QAction(QIcon.fromTheme("applications-system", QIcon(":/icons/tech.png")), "-t (Teknisk info)", self)
-        tech_action.triggered.connect(lambda: self.execute_bot_command("-t", item.text(0)))
+        tech_action = QAction(QIcon.fromTheme("applications-system", QIcon(":/icons/tech.png")), "-t (Teknisk info)", menu)
+        tech_action.triggered.connect(functools.partial(self._ctx_command, "-t"))
         bot_menu.addAction(tech_action)
         
-        compat_action = QAction(QIcon.fromTheme("network-wired", QIcon(":/icons/compat.png")), "-c (Kompatibilitet)", self)
-        compat_action.triggered.connect(lambda: self.execute_bot_command("-c", item.text(0)))
+        compat_action = QAction(QIcon.fromTheme("network-wired", QIcon(":/icons/compat.png")), "-c (Kompatibilitet)", menu)
+        compat_action.triggered.connect(functools.partial(self._ctx_command, "-c"))
         bot_menu.addAction(compat_action)
         
-        summary_action = QAction(QIcon.fromTheme("help-about", QIcon(":/icons/summary.png")), "-s (Sammanfattning)", self)
-        summary_action.triggered.connect(lambda: self.execute_bot_command("-s", item.text(0)))
+        summary_action = QAction(QIcon.fromTheme("help-about", QIcon(":/icons/summary.png")), "-s (Sammanfattning)", menu)
+        summary_action.triggered.connect(functools.partial(self._ctx_command, "-s"))
         bot_menu.addAction(summary_action)
         
-        full_action = QAction(QIcon.fromTheme("text-x-generic", QIcon(":/icons/full.png")), "-f (Fullständig info)", self)
-        full_action.triggered.connect(lambda: self.execute_bot_command("-f", item.text(0)))
+        full_action = QAction(QIcon.fromTheme("text-x-generic", QIcon(":/icons/full.png")), "-f (Fullständig info)", menu)
+        full_action.triggered.connect(functools.partial(self._ctx_command, "-f"))
         bot_menu.addAction(full_action)
         
         menu.addSeparator()
         
         # Avancerade åtgärder
-        export_action = QAction(QIcon.fromTheme("document-save-as", QIcon(":/icons/export.png")), "Exportera data", self)
-        export_action.triggered.connect(lambda: self.export_product_data(item.text(0)))
+        export_action = QAction(QIcon.fromTheme("document-save-as", QIcon(":/icons/export.png")), "Exportera data", menu)
+        export_action.triggered.connect(self._ctx_export)
         menu.addAction(export_action)
+        return menu
+    
+    def _ctx_open(self):
+        """Öppna produkten som kontextmenyn visades för"""
+        self.on_item_double_clicked(self._ctx_current_index, 0)
+    
+    def _ctx_command(self, command: str):
+        """Kör ett botkommando för produkten som kontextmenyn visades för"""
+        self.execute_bot_command(command, self._ctx_current_index.data())
+    
+    def _ctx_export(self):
+        """Exportera produkten som kontextmenyn visades för"""
+        self.export_product_data(self._ctx_current_index.data())
+    
+    def show_context_menu(self, position):
         
-        menu.exec_(self.product_tree.viewport().mapToGlobal(position))
+        """Visa kontextmeny med avancerade åtgärder för valda produkter"""
+        index = self._selected_index()
+        if index is None:
+            return
+        
+        if not index.parent().isValid():
+            # Kontextmeny för kategorier
+            if self._category_menu is None:
+                self._category_menu = self._build_category_menu()
+            self._category_menu.exec_(self.product_tree.viewport().mapToGlobal(position))
+            return
+        
+        # Kontextmeny för produkter; menyn byggs en gång och riktas om mot aktuell rad
+        if self._product_menu is None:
+            self._product_menu = self._build_product_menu()
+        self._ctx_current_index = index
+        self._product_menu.exec_(self.product_tree.viewport().mapToGlobal(position))
+    
+    def _product_version(self, product_id: str) -> Tuple[int, ...]:
+        """Senaste mtime för produktkatalogen och dess datafiler, används som cachenyckel"""
+        product_dir = f"{self.integrated_dir / 'products'}{os.sep}{product_id}"
+        version = []
+        for name in ("", *_PRODUCT_FILES.values()):
+            try:
+                version.append(os.stat(f"{product_dir}{os.sep}{name}" if name else product_dir).st_mtime_ns)
+            except OSError:
+                version.append(0)
+        return tuple(version)
+    
+    def _run_nlp_command(self, command: str, product_id: str, version: Tuple[int, ...]) -> Dict[str, Any]:
+        """Kör kommandot i NLP-motorn (version används bara som del av cachenyckeln)"""
+        return self.bot_engine.process_input(f"{command} {product_id}", {})
+    
+    def _run_engine_command(self, command: str, product_id: str, version: Tuple[int, ...]) -> Dict[str, Any]:
+        """Kör kommandot i standardmotorn (version används bara som del av cachenyckeln)"""
+        return self.bot_engine.execute_command(command, product_id)
     
     def execute_bot_command(self, command: str, product_id: str):
         """Exekvera ett bot-kommando och visa resultatet i förhandsgranskningen"""
         self.status_bar.showMessage(f"Kör kommando {command} för produkt {product_id}...")
         
         try:
-            # Olika anrop beroende på motortyp
-            if NLP_AVAILABLE:
-                # För NLP-motorn
-                text = f"{command} {product_id}"
-                context = {}
-                result = self.bot_engine.process_input(text, context)
-                
-                if result["status"] == "success":
-                    self.bot_preview.setMarkdown(result.get("formatted_text", ""))
-                    self.status_bar.showMessage(f"Kommando {command} utfört")
-                else:
-                    error_msg = result.get("message", "Okänt fel")
-                    self.bot_preview.setMarkdown(f"# Fel\n\n{error_msg}")
-                    self.status_bar.showMessage(f"Fel vid körning av kommando")
+            result = self._preview_cache(command, product_id, self._product_version(product_id))
+            
+            if result["status"] == "success":
+                self.bot_preview.setMarkdown(result.get("formatted_text", ""))
+                self.status_bar.showMessage(f"Kommando {command} utfört")
             else:
-                # För standardmotorn
-                result = self.bot_engine.execute_command(command, product_id)
-                
-                if result["status"] == "success":
-                    self.bot_preview.setMarkdown(result.get("formatted_text", ""))
-                    self.status_bar.showMessage(f"Kommando {command} utfört")
-                else:
-                    error_msg = result.get("message", "Okänt fel")
-                    self.bot_preview.setMarkdown(f"# Fel\n\n{error_msg}")
-                    self.status_bar.showMessage(f"Fel vid körning av kommando")
+                error_msg = result.get("message", "Okänt fel")
+                self.bot_preview.setMarkdown(f"# Fel\n\n{error_msg}")
+                self.status_bar.showMessage(f"Fel vid körning av kommando")
             
         except Exception as e:
             logger.error(f"Fel vid körning av botkommando: {str(e)}")
@@ -755,21 +1345,10 @@ class ProductExplorer(QWidget):
     
     def update_bot_preview(self, product_id: str, file_path: Path):
         """Uppdatera förhandsgranskning baserat på filtyp och aktuellt valt kommando"""
-        file_str = str(file_path)
-        
         # Välj lämpligt kommando baserat på filtypen
-        if "technical_specs.jsonl" in file_str:
-            command_index = self.preview_command.findData("-t")
-            if command_index >= 0:
-                self.preview_command.setCurrentIndex(command_index)
-        elif "compatibility.jsonl" in file_str:
-            command_index = self.preview_command.findData("-c")
-            if command_index >= 0:
-                self.preview_command.setCurrentIndex(command_index)
-        elif "summary.jsonl" in file_str:
-            command_index = self.preview_command.findData("-s")
-            if command_index >= 0:
-                self.preview_command.setCurrentIndex(command_index)
+        command_index = _PREVIEW_COMMAND_INDEX.get(_FILENAME_TO_COMMAND.get(file_path.name))
+        if command_index is not None:
+            self.preview_command.setCurrentIndex(command_index)
         
         # Kör kommandot för förhandsgranskning
         command = self.preview_command.currentData()
@@ -778,12 +1357,11 @@ class ProductExplorer(QWidget):
     
     def update_preview_for_current(self):
         """Uppdatera förhandsgranskning för aktuellt valt kommando och produkt"""
-        items = self.product_tree.selectedItems()
-        if not items or items[0].parent() is None:
+        index = self._selected_index()
+        if index is None or not index.parent().isValid():
             return
         
-        item = items[0]
-        product_id = item.text(0)
+        product_id = index.data()
         command = self.preview_command.currentData()
         
         if product_id and command:
@@ -791,16 +1369,15 @@ class ProductExplorer(QWidget):
     
     def export_data(self):
         """Exportera all data för en produkt eller kategori"""
-        items = self.product_tree.selectedItems()
-        if not items:
+        index = self._selected_index()
+        if index is None:
             QMessageBox.information(self, "Info", "Välj en produkt eller kategori först")
             return
         
-        item = items[0]
-        
-        if item.parent() is None:
+
+        if not index.parent().isValid():
             # Exportera alla produkter i en kategori
-            category_name = item.text(0)
+            category_name = index.data()
             export_dir = QFileDialog.getExistingDirectory(
                 self, f"Välj mapp för export av {category_name}",
                 str(Path.home())
@@ -809,32 +1386,43 @@ class ProductExplorer(QWidget):
             if not export_dir:
                 return
             
-            try:
-                export_count = 0
-                for i in range(item.childCount()):
-                    child = item.child(i)
-                    product_id = child.text(0)
-                    file_path = child.data(0, Qt.UserRole)
-                    
-                    if file_path:
-                        target_path = os.path.join(export_dir, f"{product_id}_{item.text(0)}.jsonl")
-                        shutil.copy2(file_path, target_path)
-                        export_count += 1
+            pairs = []
+            model = self.product_model
+            for i in range(model.rowCount(index)):
+                child = model.index(i, 0, index)
+                product_id = child.data()
+                file_path = child.data(Qt.UserRole)
                 
-                QMessageBox.information(
-                    self, 
-                    "Export klar", 
-                    f"Exporterade {export_count} filer till {export_dir}"
-                )
-                self.status_bar.showMessage(f"Exporterade {export_count} filer")
-                
-            except Exception as e:
-                logger.error(f"Fel vid export: {str(e)}")
-                QMessageBox.warning(self, "Fel", f"Kunde inte exportera data: {str(e)}")
-                self.status_bar.showMessage("Fel vid export")
+                if file_path:
+                    target_path = os.path.join(export_dir, f"{product_id}_{category_name}.jsonl")
+                    pairs.append((file_path, target_path))
+            
+            # Filerna kopieras i en bakgrundstråd
+            job = _FileCopyJob(pairs, export_dir)
+            job.signals.finished.connect(self._on_files_exported, Qt.QueuedConnection)
+            job.signals.failed.connect(self._on_files_export_failed, Qt.QueuedConnection)
+            self.status_bar.showMessage(f"Exporterar {len(pairs)} filer...")
+            self._scan_pool.start(job)
         else:
             # Exportera en specifik produkt
-            self.export_product_data(item.text(0))
+            self.export_product_data(index.data())
+    
+    @Slot(int, str)
+    def _on_files_exported(self, export_count: int, export_dir: str):
+        """Kategoriexporten är klar"""
+        QMessageBox.information(
+            self, 
+            "Export klar", 
+            f"Exporterade {export_count} filer till {export_dir}"
+        )
+        self.status_bar.showMessage(f"Exporterade {export_count} filer")
+    
+    @Slot(str)
+    def _on_files_export_failed(self, error: str):
+        """Kategoriexporten misslyckades"""
+        logger.error(f"Fel vid export: {error}")
+        QMessageBox.warning(self, "Fel", f"Kunde inte exportera data: {error}")
+        self.status_bar.showMessage("Fel vid export")
     
     def export_product_data(self, product_id: str):
         """Exportera alla data för en specifik produkt"""
@@ -848,60 +1436,30 @@ class ProductExplorer(QWidget):
         if not export_path:
             return
         
-        try:
-            # Samla all data för produkten
-            product_dir = self.integrated_dir / "products" / product_id
-            
-            export_data = {
-                "product_id": product_id,
-                "exported_at": datetime.now().isoformat(),
-                "technical_specs": [],
-                "compatibility": [],
-                "article_info": [],
-                "summary": {}
-            }
-            
-            # Ladda tekniska specifikationer
-            tech_path = product_dir / "technical_specs.jsonl"
-            if tech_path.exists():
-                with open(tech_path, 'r', encoding='utf-8') as f:
-                    export_data["technical_specs"] = [json.loads(line) for line in f if line.strip()]
-            
-            # Ladda kompatibilitetsinformation
-            compat_path = product_dir / "compatibility.jsonl"
-            if compat_path.exists():
-                with open(compat_path, 'r', encoding='utf-8') as f:
-                    export_data["compatibility"] = [json.loads(line) for line in f if line.strip()]
-            
-            # Ladda artikeldata
-            article_path = product_dir / "article_info.jsonl"
-            if article_path.exists():
-                with open(article_path, 'r', encoding='utf-8') as f:
-                    export_data["article_info"] = [json.loads(line) for line in f if line.strip()]
-            
-            # Ladda sammanfattning
-            summary_path = product_dir / "summary.jsonl"
-            if summary_path.exists():
-                with open(summary_path, 'r', encoding='utf-8') as f:
-                    first_line = f.readline().strip()
-                    if first_line:
-                        export_data["summary"] = json.loads(first_line)
-            
-            # Spara exportdata till JSON-fil
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
-            
-            QMessageBox.information(
-                self, 
-                "Export klar", 
-                f"Data för produkt {product_id} exporterad till {export_path}"
-            )
-            self.status_bar.showMessage(f"Exporterade data för {product_id}")
-            
-        except Exception as e:
-            logger.error(f"Fel vid export av produktdata: {str(e)}")
-            QMessageBox.warning(self, "Fel", f"Kunde inte exportera produktdata: {str(e)}")
-            self.status_bar.showMessage("Fel vid export av produktdata")
+        # Läsning, parsning och skrivning sker i en bakgrundstråd
+        product_dir = self.integrated_dir / "products" / product_id
+        job = _ProductExportJob(product_dir, product_id, export_path)
+        job.signals.finished.connect(self._on_product_exported, Qt.QueuedConnection)
+        job.signals.failed.connect(self._on_product_export_failed, Qt.QueuedConnection)
+        self.status_bar.showMessage(f"Exporterar data för {product_id}...")
+        self._scan_pool.start(job)
+    
+    @Slot(str, str)
+    def _on_product_exported(self, product_id: str, export_path: str):
+        """Exporten är klar"""
+        QMessageBox.information(
+            self, 
+            "Export klar", 
+            f"Data för produkt {product_id} exporterad till {export_path}"
+        )
+        self.status_bar.showMessage(f"Exporterade data för {product_id}")
+    
+    @Slot(str, str)
+    def _on_product_export_failed(self, product_id: str, error: str):
+        """Exporten misslyckades"""
+        logger.error(f"Fel vid export av produktdata: {error}")
+        QMessageBox.warning(self, "Fel", f"Kunde inte exportera produktdata: {error}")
+        self.status_bar.showMessage("Fel vid export av produktdata")
     
     def open_bot_test(self):
         """Öppna ett testfönster för botinteraktion"""
@@ -932,18 +1490,21 @@ class ProductExplorer(QWidget):
     def select_product(self, product_id: str):
         """
         Programmatisk markering av en produkt i trädet baserat på produkt-ID.
-        Söker igenom alla kategorier och väljer första förekomsten.
+        Väljer första förekomsten via produktindexet.
         """
-        for i in range(self.product_tree.topLevelItemCount()):
-            category = self.product_tree.topLevelItem(i)
-            for j in range(category.childCount()):
-                item = category.child(j)
-                if item.text(0) == product_id:
-                    self.product_tree.setCurrentItem(item)
-                    self.product_tree.scrollToItem(item)
-                    # Simulera dubbelklick för att ladda produkt
-                    self.on_item_double_clicked(item, 0)
-                    return
+        source = self.product_model.product_index(product_id)
+        if not source.isValid():
+            # Om produkten inte hittades
+            self.status_bar.showMessage(f"Produkt {product_id} hittades inte")
+            return
         
-        # Om produkten inte hittades
-        self.status_bar.showMessage(f"Produkt {product_id} hittades inte")
\ No newline at end of file
+        index = self.product_proxy.mapFromSource(source)
+        if not index.isValid():
+            # Dold av sökfiltret; rensa filtret så att produkten syns
+            self.search_input.clear()
+            self._apply_filter()
+            index = self.product_proxy.mapFromSource(source)
+        self.product_tree.setCurrentIndex(index)
+        self.product_tree.scrollTo(index)
+        # Simulera dubbelklick för att ladda produkt
+        self.on_item_double_clicked(source, 0)
\ No newline at end of file
@@ -1,20 +1,243 @@
 # ..\..\modules\report_viewer.py
 # modules/report_viewer.py
 
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget,
-                             QTreeWidgetItem, QTextEdit, QPushButton, QLabel,
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
+                             QAbstractItemView, QTextEdit, QPlainTextEdit, QPushButton, QLabel,
                              QComboBox, QTabWidget, QSplitter, QMenu, QMessageBox)
-from PySide6.QtCore import Qt, Signal, Slot, QTimer
-from PySide6.QtGui import QAction, QColor
+from PySide6.QtCore import (Qt, Signal, Slot, QTimer, QObject, QRunnable, QThreadPool,
+                            QFileSystemWatcher, QSortFilterProxyModel, QItemSelectionModel)
+from PySide6.QtGui import QAction, QColor, QStandardItem, QStandardItemModel
 
 import json
 import logging
+import os
+import re
 from pathlib import Path
 from datetime import datetime
+from operator import itemgetter
 import markdown
 
+# Use orjson for report parsing/formatting when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# One Markdown converter for the viewer (GUI thread only), reset between documents
+_MD = markdown.Markdown()
+
+
+def _render_markdown(text):
+    """Convert markdown to HTML with the shared converter"""
+    return _MD.reset().convert(text)
+
+
+def _loads(data: bytes):
+    """Parse a JSON document, with orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or integers wider than 64 bits, let json decide
+    return json.loads(data)
+
+
+def _dumps_indented(data) -> str:
+    """Serialize a JSON object with two-space indentation"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass  # e.g. non-string keys
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+# Report files are listed from their head only; the full data is parsed when a report is opened
+_HEAD_SIZE = 4096
+_TIMESTAMP_RE = re.compile(rb'[{,]\s*"timestamp"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def _timestamp_sort_key(timestamp):
+    """Seconds since the epoch for an ISO timestamp; missing or unparsable ones sort last"""
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError, OverflowError):
+        return float("-inf")
+
+
+def _read_timestamp(path):
+    """
+    Read a report's top-level "timestamp" without parsing the whole file.
+    Only the head of the file is searched; if the key is not found there
+    (or might be nested) the file is parsed in full.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(_HEAD_SIZE)
+        match = _TIMESTAMP_RE.search(head)
+        if match is not None:
+            prefix = head[:match.start() + 1]
+            if prefix.count(b"{") == 1 and b"[" not in prefix:
+                try:
+                    return _loads(b'"' + match.group(1) + b'"')
+                except ValueError:
+                    pass  # Not a valid JSON string, let the full parse decide
+        data = _loads(head + f.read())
+    return data.get("timestamp", "Unknown")
+
+
+def _load_report(path, cache, new_cache):
+    """
+    Read a report's timestamp and compute its sort key, reusing both while the
+    file's mtime and size are unchanged. Returns (timestamp, sort_key).
+    """
+    st = path.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = cache.get(path)
+    if cached is not None and cached[0] == signature:
+        _, timestamp, sort_key = cached
+    else:
+        timestamp = _read_timestamp(path)
+        sort_key = _timestamp_sort_key(timestamp)
+    new_cache[path] = (signature, timestamp, sort_key)
+    return timestamp, sort_key
+
+
+def _list_dir(path):
+    """Non-hidden entries of a directory, or nothing if it does not exist (like glob)"""
+    try:
+        with os.scandir(path) as it:
+            return [entry for entry in it if not entry.name.startswith(".")]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _scan_reports(integrated_data_dir, cache):
+    """
+    Find all reports and read their timestamps, newest first (runs on a worker thread).
+    The report data itself is left as None until the report is opened.
+    Returns (reports, new_cache, watch_paths); files that no longer exist drop out of
+    the cache, watch_paths lists the command_responses directories and report files found.
+    """
+    reports = []
+    new_cache = {}
+    watch_paths = []
+    
+    # Command responses
+    for product_entry in _list_dir(integrated_data_dir / "products"):
+        if not product_entry.is_dir():
+            continue
+        product_id = product_entry.name
+        response_dir = os.path.join(product_entry.path, "command_responses")
+        entries = _list_dir(response_dir)
+        if entries or os.path.isdir(response_dir):
+            watch_paths.append(response_dir)
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            response_file = Path(entry.path)
+            report_type = response_file.stem.replace("_response", "")
+            
+            try:
+                timestamp, sort_key = _load_report(response_file, cache, new_cache)
+                reports.append({
+                    "type": "command",
+                    "subtype": report_type,
+                    "product_id": product_id,
+                    "path": response_file,
+                    "timestamp": timestamp,
+                    "sort_key": sort_key,
+                    "data": None
+                })
+            except Exception as e:
+                logger.error(f"Error reading command response {response_file}: {e}")
+    
+    # Integration and validation reports share one listing of the data directory
+    for entry in _list_dir(integrated_data_dir):
+        name = entry.name
+        if not name.endswith(".json"):
+            continue
+        if name.startswith("integration_report_"):
+            report_type, label = "integration", "integration report"
+        elif name.startswith("validation_report_"):
+            report_type, label = "validation", "validation report"
+        else:
+            continue
+        report_file = Path(entry.path)
+        
+        try:
+            timestamp, sort_key = _load_report(report_file, cache, new_cache)
+            reports.append({
+                "type": report_type,
+                "path": report_file,
+                "timestamp": timestamp,
+                "sort_key": sort_key,
+                "data": None
+            })
+        except Exception as e:
+            logger.error(f"Error reading {label} {report_file}: {e}")
+    
+    # Sort reports by timestamp (newest first)
+    reports.sort(key=itemgetter("sort_key"), reverse=True)
+    watch_paths.extend(str(report["path"]) for report in reports)
+    return reports, new_cache, watch_paths
+
+
+class _ReportScanSignals(QObject):
+    """Signals from the background report scan"""
+    finished = Signal(int, object)  # generation, (reports, cache, watch_paths)
+    failed = Signal(int, str)       # generation, error message
+
+
+class _ReportScanJob(QRunnable):
+    """Scans and parses the report files on a worker thread"""
+    
+    def __init__(self, integrated_data_dir, cache, generation):
+        super().__init__()
+        self.integrated_data_dir = integrated_data_dir
+        self.cache = cache
+        self.generation = generation
+        self.signals = _ReportScanSignals()
+    
+    def run(self):
+        try:
+            result = _scan_reports(self.integrated_data_dir, self.cache)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, result)
+
+
+class _ReportFilterProxy(QSortFilterProxyModel):
+    """Shows only the rows whose "Typ" column matches the selected report type"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._report_type = None  # None shows all reports
+    
+    def set_report_type(self, report_type):
+        """Change the report type to show and refilter"""
+        if report_type != self._report_type:
+            self._report_type = report_type
+            self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._report_type is None:
+            return True
+        index = self.sourceModel().index(source_row, 2, source_parent)
+        return index.data() == self._report_type
+
+
+def _report_row(name, timestamp, type_name, cache_key):
+    """Items for one row in the report list; the cache key is stored on the first column"""
+    row = [QStandardItem(name), QStandardItem(timestamp), QStandardItem(type_name)]
+    for item in row:
+        item.setEditable(False)
+    row[0].setData(cache_key, Qt.UserRole)
+    return row
+
+
 class ReportViewer(QWidget):
     """Widget for viewing various reports and command responses"""
     
@@ -28,15 +251,26 @@ class ReportViewer(QWidget):
         # Initialize state
         self.current_report = None
         self.report_cache = {}
+        self._scan_generation = 0  # Results from superseded scans are dropped
+        self._file_cache = {}  # path -> ((mtime_ns, size), timestamp, sort key)
         self.integrated_data_dir = Path(config.get("integrated_data_dir", "./nlp_bot_engine/data/integrated_data"))
         
         # Initialize UI
         self.init_ui()
         
-        # Start periodic refresh
+        # Refresh when the report directories change; bursts of writes are coalesced
+        self._refresh_delay = QTimer(self)
+        self._refresh_delay.setSingleShot(True)
+        self._refresh_delay.setInterval(500)
+        self._refresh_delay.timeout.connect(self.refresh_reports)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self._schedule_refresh)
+        self.watcher.fileChanged.connect(self._schedule_refresh)
+        
+        # Slow periodic refresh as a fallback for changes the watcher misses
         self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.refresh_reports)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        self.refresh_timer.start(300000)  # Refresh every 5 minutes
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -68,12 +302,19 @@ class ReportViewer(QWidget):
         # Main splitter
         splitter = QSplitter(Qt.Vertical)
         
-        # Report tree
-        self.report_tree = QTreeWidget()
-        self.report_tree.setHeaderLabels(["Rapport", "Datum", "Typ"])
+        # Report list: item model, filtered by report type in a proxy model
+        self.report_model = self._new_report_model()
+        self.report_proxy = _ReportFilterProxy(self)
+        self.report_proxy.setSourceModel(self.report_model)
+        
+        self.report_tree = QTreeView()
+        self.report_tree.setModel(self.report_proxy)
+        self.report_tree.setRootIsDecorated(False)
+        self.report_tree.setUniformRowHeights(True)
+        self.report_tree.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.report_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.report_tree.customContextMenuRequested.connect(self.show_context_menu)
-        self.report_tree.itemSelectionChanged.connect(self.on_report_selected)
+        self.report_tree.selectionModel().selectionChanged.connect(self.on_report_selected)
         
         # Report content viewer (tabbed)
         self.content_tabs = QTabWidget()
@@ -83,9 +324,10 @@ class ReportViewer(QWidget):
         self.html_view.setReadOnly(True)
         self.content_tabs.addTab(self.html_view, "Formaterad vy")
         
-        # Raw view tab
-        self.raw_view = QTextEdit()
+        # Raw view tab (plain text layout, no wrapping, so large JSON stays cheap to show)
+        self.raw_view = QPlainTextEdit()
         self.raw_view.setReadOnly(True)
+        self.raw_view.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.content_tabs.addTab(self.raw_view, "Rådata")
         
         # Add widgets to splitter
@@ -101,127 +343,114 @@ class ReportViewer(QWidget):
         self.refresh_reports()
     
     def refresh_reports(self):
-        """Refresh the report list"""
-        self.report_tree.clear()
+        """Refresh the report list (files are read and parsed on a worker thread)"""
+        self._scan_generation += 1
+        job = _ReportScanJob(self.integrated_data_dir, self._file_cache, self._scan_generation)
+        job.signals.finished.connect(self._on_reports_scanned, Qt.QueuedConnection)
+        job.signals.failed.connect(self._on_reports_scan_failed, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(job)
+    
+    @Slot(str)
+    def _schedule_refresh(self, path=None):
+        """Restart the refresh delay after a directory or report file change"""
+        self._refresh_delay.start()
+    
+    def _watch_paths(self, paths):
+        """Watch the data directory, products/ and the directories and report files from a scan"""
+        wanted = [str(self.integrated_data_dir), str(self.integrated_data_dir / "products"), *paths]
+        watched = set(self.watcher.directories())
+        watched.update(self.watcher.files())
+        new_paths = [p for p in wanted if p not in watched and os.path.exists(p)]
+        if new_paths:
+            self.watcher.addPaths(new_paths)
+    
+    @Slot(int, str)
+    def _on_reports_scan_failed(self, generation, error):
+        """Report a failed scan, unless a newer one has been started"""
+        if generation != self._scan_generation:
+            return
+        logger.error(f"Error refreshing reports: {error}")
+        QMessageBox.warning(self, "Fel", f"Kunde inte uppdatera rapportlistan: {error}")
+    
+    @Slot(int, object)
+    def _on_reports_scanned(self, generation, result):
+        """Rebuild the report tree from a finished scan on the GUI thread"""
+        if generation != self._scan_generation:
+            return  # A newer scan has been started
+        reports, self._file_cache, watch_paths = result
+        self._watch_paths(watch_paths)
+        
         self.report_cache.clear()
         
-        try:
-            # Find all reports
-            reports = []
-            
-            # Command responses
-            for product_dir in self.integrated_data_dir.glob("products/*/command_responses"):
-                for response_file in product_dir.glob("*.json"):
-                    product_id = product_dir.parent.name
-                    report_type = response_file.stem.replace("_response", "")
-                    
-                    try:
-                        with open(response_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            timestamp = data.get("timestamp", "Unknown")
-                            reports.append({
-                                "type": "command",
-                                "subtype": report_type,
-                                "product_id": product_id,
-                                "path": response_file,
-                                "timestamp": timestamp,
-                                "data": data
-                            })
-                    except Exception as e:
-                        logger.error(f"Error reading command response {response_file}: {e}")
-            
-            # Integration reports
-            for report_file in self.integrated_data_dir.glob("integration_report_*.json"):
-                try:
-                    with open(report_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        timestamp = data.get("timestamp", "Unknown")
-                        reports.append({
-                            "type": "integration",
-                            "path": report_file,
-                            "timestamp": timestamp,
-                            "data": data
-                        })
-                except Exception as e:
-                    logger.error(f"Error reading integration report {report_file}: {e}")
-            
-            # Validation reports
-            for report_file in self.integrated_data_dir.glob("validation_report_*.json"):
-                try:
-                    with open(report_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        timestamp = data.get("timestamp", "Unknown")
-                        reports.append({
-                            "type": "validation",
-                            "path": report_file,
-                            "timestamp": timestamp,
-                            "data": data
-                        })
-                except Exception as e:
-                    logger.error(f"Error reading validation report {report_file}: {e}")
-            
-            # Sort reports by timestamp (newest first)
-            reports.sort(key=lambda x: x["timestamp"], reverse=True)
-            
-            # Create tree items
-            for report in reports:
-                item = QTreeWidgetItem()
-                
-                # Set item text based on report type
-                if report["type"] == "command":
-                    item.setText(0, f"{report['product_id']} - {report['subtype']}")
-                    item.setText(1, report["timestamp"])
-                    item.setText(2, "Kommandosvar")
-                else:
-                    item.setText(0, report["path"].stem)
-                    item.setText(1, report["timestamp"])
-                    item.setText(2, "Integrationsrapport" if report["type"] == "integration" else "Valideringsrapport")
-                
-                # Store report data in cache
-                cache_key = f"{report['type']}_{report['path']}"
-                self.report_cache[cache_key] = report
-                item.setData(0, Qt.UserRole, cache_key)
-                
-                self.report_tree.addTopLevelItem(item)
+        # Rows are added to a new model that no view is attached to yet, then swapped in with one reset
+        model = self._new_report_model()
+        
+        # Create rows
+        for report in reports:
+            cache_key = f"{report['type']}_{report['path']}"
             
-            # Resize columns to content
-            for i in range(3):
-                self.report_tree.resizeColumnToContents(i)
+            # Set row text based on report type
+            if report["type"] == "command":
+                name = f"{report['product_id']} - {report['subtype']}"
+                type_name = "Kommandosvar"
+            else:
+                name = report["path"].stem
+                type_name = "Integrationsrapport" if report["type"] == "integration" else "Valideringsrapport"
             
-        except Exception as e:
-            logger.error(f"Error refreshing reports: {e}")
-            QMessageBox.warning(self, "Fel", f"Kunde inte uppdatera rapportlistan: {str(e)}")
+            # Store report data in cache
+            self.report_cache[cache_key] = report
+            model.appendRow(_report_row(name, str(report["timestamp"]), type_name, cache_key))
+        
+        self.report_proxy.setSourceModel(model)
+        self.report_model.deleteLater()
+        self.report_model = model
+        
+        # Resize columns to content
+        for i in range(3):
+            self.report_tree.resizeColumnToContents(i)
+    
+    def _new_report_model(self):
+        """Empty item model for the report list"""
+        model = QStandardItemModel(0, 3, self)
+        model.setHorizontalHeaderLabels(["Rapport", "Datum", "Typ"])
+        return model
     
     def filter_reports(self):
         """Filter reports based on selected type"""
         filter_text = self.type_filter.currentText()
         
-        # Show all items first
-        for i in range(self.report_tree.topLevelItemCount()):
-            item = self.report_tree.topLevelItem(i)
-            item.setHidden(False)
-        
         # Apply filter if not "Alla rapporter"
-        if filter_text != "Alla rapporter":
-            for i in range(self.report_tree.topLevelItemCount()):
-                item = self.report_tree.topLevelItem(i)
-                if item.text(2) != filter_text:
-                    item.setHidden(True)
+        self.report_proxy.set_report_type(None if filter_text == "Alla rapporter" else filter_text)
+    
+    def _selected_report(self):
+        """The report for the selected row, or None"""
+        rows = self.report_tree.selectionModel().selectedRows(0)
+        if not rows:
+            return None
+        return self.report_cache.get(rows[0].data(Qt.UserRole))
     
     def on_report_selected(self):
         """Handle report selection"""
-        items = self.report_tree.selectedItems()
-        if not items:
-            return
-        
-        item = items[0]
-        cache_key = item.data(0, Qt.UserRole)
-        report = self.report_cache.get(cache_key)
-        
-        if report:
+        report = self._selected_report()
+        
+        # Rows inserted above the selection re-emit selectionChanged for the same report
+        if report and report is not self.current_report:
+            try:
+                data = self._report_data(report)
+            except Exception as e:
+                logger.error(f"Error reading report {report.get('path')}: {e}")
+                QMessageBox.warning(self, "Fel", f"Kunde inte läsa rapporten: {str(e)}")
+                return
             self.current_report = report
             self.display_report(report)
-            self.report_selected.emit(report["type"], report["data"])
+            self.report_selected.emit(report["type"], data)
+    
+    def _report_data(self, report):
+        """Parse the report file the first time the report is opened"""
+        if report["data"] is None:
+            with open(report["path"], 'rb') as f:
+                report["data"] = _loads(f.read())
+        return report["data"]
     
     def display_report(self, report):
         """Display the selected report"""
@@ -236,56 +465,53 @@ class ReportViewer(QWidget):
         """Display a command response"""
         data = report["data"]
         
-        # Format HTML view
-        html = f"<h1>Kommandosvar: {report['subtype']}</h1>\n"
-        html += f"<p><strong>Produkt:</strong> {report['product_id']}</p>\n"
-        html += f"<p><strong>Tidpunkt:</strong> {report['timestamp']}</p>\n"
+        # Format HTML view (parts are joined once at the end)
+        parts = [
+            f"<h1>Kommandosvar: {report['subtype']}</h1>\n",
+            f"<p><strong>Produkt:</strong> {report['product_id']}</p>\n",
+            f"<p><strong>Tidpunkt:</strong> {report['timestamp']}</p>\n"
+        ]
         
         # Add markdown response if available
         if "markdown_response" in data:
-            html += "\n<hr>\n"
-            html += markdown.markdown(data["markdown_response"])
+            parts.append("\n<hr>\n")
+            parts.append(_render_markdown(data["markdown_response"]))
         
-        self.html_view.setHtml(html)
+        self.html_view.setHtml("".join(parts))
         
         # Raw view
-        self.raw_view.setPlainText(
-            json.dumps(data, ensure_ascii=False, indent=2)
-        )
+        self.raw_view.setPlainText(_dumps_indented(data))
     
     def display_general_report(self, report):
         """Display a general report (integration or validation)"""
         data = report["data"]
         
-        # Format HTML view
-        html = f"<h1>{report['path'].stem}</h1>\n"
-        html += f"<p><strong>Typ:</strong> {report['type'].title()}</p>\n"
-        html += f"<p><strong>Tidpunkt:</strong> {report['timestamp']}</p>\n"
+        # Format HTML view (parts are joined once at the end)
+        parts = [
+            f"<h1>{report['path'].stem}</h1>\n",
+            f"<p><strong>Typ:</strong> {report['type'].title()}</p>\n",
+            f"<p><strong>Tidpunkt:</strong> {report['timestamp']}</p>\n"
+        ]
         
         # Add statistics if available
-        if "statistics" in data:
-            html += "\n<h2>Statistik</h2>\n<ul>\n"
-            for key, value in data["statistics"].items():
-                if isinstance(value, (int, float)):
-                    html += f"<li><strong>{key}:</strong> {value}</li>\n"
-            html += "</ul>\n"
-        
-        self.html_view.setHtml(html)
+        statistics = data.get("statistics")
+        if statistics is not None:
+            parts.append("\n<h2>Statistik</h2>\n<ul>\n")
+            parts += [
+                f"<li><strong>{key}:</strong> {value}</li>\n"
+                for key, value in statistics.items()
+                if isinstance(value, (int, float))
+            ]
+            parts.append("</ul>\n")
+        
+        self.html_view.setHtml("".join(parts))
         
         # Raw view
-        self.raw_view.setPlainText(
-            json.dumps(data, ensure_ascii=False, indent=2)
-        )
+        self.raw_view.setPlainText(_dumps_indented(data))
     
     def show_context_menu(self, position):
         """Show context menu for reports"""
-        items = self.report_tree.selectedItems()
-        if not items:
-            return
-        
-        item = items[0]
-        cache_key = item.data(0, Qt.UserRole)
-        report = self.report_cache.get(cache_key)
+        report = self._selected_report()
         
         if report:
             menu = QMenu()
@@ -326,16 +552,13 @@ class ReportViewer(QWidget):
         cache_key = f"command_{product_id}_{command}"
         self.report_cache[cache_key] = report
         
-        # Create tree item
-        item = QTreeWidgetItem()
-        item.setText(0, f"{product_id} - {command}")
-        item.setText(1, report["timestamp"])
-        item.setText(2, "Kommandosvar")
-        item.setData(0, Qt.UserRole, cache_key)
-        
-        # Add to tree and select
-        self.report_tree.insertTopLevelItem(0, item)
-        item.setSelected(True)
+        # Add row at the top and select it (unless the type filter hides it)
+        self.report_model.insertRow(0, _report_row(f"{product_id} - {command}", report["timestamp"], "Kommandosvar", cache_key))
+        index = self.report_proxy.mapFromSource(self.report_model.index(0, 0))
+        if index.isValid():
+            self.report_tree.selectionModel().select(
+                index, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+            )
         
         # Display report
         self.display_report(report)
@@ -349,12 +572,12 @@ class ReportViewer(QWidget):
         """
         try:
             # Format the preview data as a pretty-printed JSON string
-            formatted = json.dumps(preview_data, indent=2, ensure_ascii=False)
+            formatted = _dumps_indented(preview_data)
             # Update the raw view with the formatted JSON
             self.raw_view.setPlainText(formatted)
             # If the preview data contains a markdown response, convert it; otherwise, show the JSON string in the HTML view
             if "markdown_response" in preview_data:
-                html_content = markdown.markdown(preview_data["markdown_response"])
+                html_content = _render_markdown(preview_data["markdown_response"])
                 self.html_view.setHtml(html_content)
             else:
                 self.html_view.setPlainText(formatted)
@@ -4,13 +4,31 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
                              QLabel, QLineEdit, QSpinBox, QComboBox, QPushButton,
                              QGroupBox, QCheckBox, QScrollArea, QTabWidget,
                              QFileDialog, QMessageBox)
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtCore import Qt, Signal, QSize, QTimer
 import json
 import logging
+import os
 from pathlib import Path
 
+# Serialize the config with orjson when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _dump_config(config):
+    """Serialize the config to UTF-8 JSON bytes, with orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, let json decide
+    return json.dumps(config, ensure_ascii=False, indent=2).encode('utf-8')
+
+
 class SettingsPanel(QWidget):
     """A comprehensive settings panel for configuring the application"""
     
@@ -20,6 +38,14 @@ class SettingsPanel(QWidget):
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.config = config
+        
+        # Text and spin box edits are emitted once typing pauses, with the latest value per setting
+        self._pending_settings = {}
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(200)
+        self._settings_timer.timeout.connect(self._emit_pending_settings)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -87,7 +113,7 @@ class SettingsPanel(QWidget):
         self.font_size_spin.setRange(8, 24)
         self.font_size_spin.setValue(self.config.get("font_size", 12))
         self.font_size_spin.valueChanged.connect(
-            lambda v: self.settings_changed.emit("font_size", v)
+            lambda v: self._schedule_setting("font_size", v)
         )
         ui_layout.addRow("Textstorlek:", self.font_size_spin)
         
@@ -114,7 +140,7 @@ class SettingsPanel(QWidget):
             )
         )
         self.tech_template_edit.textChanged.connect(
-            lambda v: self.settings_changed.emit("bot_settings.response_template_tech", v)
+            lambda v: self._schedule_setting("bot_settings.response_template_tech", v)
         )
         template_layout.addWidget(tech_label)
         template_layout.addWidget(self.tech_template_edit)
@@ -128,7 +154,7 @@ class SettingsPanel(QWidget):
             )
         )
         self.compat_template_edit.textChanged.connect(
-            lambda v: self.settings_changed.emit("bot_settings.response_template_compat", v)
+            lambda v: self._schedule_setting("bot_settings.response_template_compat", v)
         )
         template_layout.addWidget(compat_label)
         template_layout.addWidget(self.compat_template_edit)
@@ -142,7 +168,7 @@ class SettingsPanel(QWidget):
             )
         )
         self.summary_template_edit.textChanged.connect(
-            lambda v: self.settings_changed.emit("bot_settings.response_template_summary", v)
+            lambda v: self._schedule_setting("bot_settings.response_template_summary", v)
         )
         template_layout.addWidget(summary_label)
         template_layout.addWidget(self.summary_template_edit)
@@ -159,7 +185,7 @@ class SettingsPanel(QWidget):
         self.max_workers_spin.setRange(1, 32)
         self.max_workers_spin.setValue(self.config.get("max_workers", 4))
         self.max_workers_spin.valueChanged.connect(
-            lambda v: self.settings_changed.emit("max_workers", v)
+            lambda v: self._schedule_setting("max_workers", v)
         )
         perf_layout.addRow("Max antal arbetare:", self.max_workers_spin)
         
@@ -189,13 +215,27 @@ class SettingsPanel(QWidget):
         scroll.setWidget(content)
         layout.addWidget(scroll)
     
+    def _schedule_setting(self, setting_name, value):
+        """Remember the latest value and restart the debounce delay"""
+        self._pending_settings[setting_name] = value
+        self._settings_timer.start()
+    
+    def _emit_pending_settings(self):
+        """Emit settings_changed once for each setting edited since the last emit"""
+        pending, self._pending_settings = self._pending_settings, {}
+        for setting_name, value in pending.items():
+            self.settings_changed.emit(setting_name, value)
+    
     def browse_directory(self, setting_name):
         """Open a directory browser dialog"""
         current_dir = self.config.get(setting_name, "")
+        # Directories only and no per-folder custom icons, so slow (network) mounts
+        # are not probed for every entry; the platform's native dialog is kept
         dir_path = QFileDialog.getExistingDirectory(
             self,
             "Välj katalog",
-            current_dir
+            current_dir,
+            QFileDialog.ShowDirsOnly | QFileDialog.DontUseCustomDirectoryIcons
         )
         if dir_path:
             if setting_name == "base_dir":
@@ -225,8 +265,18 @@ class SettingsPanel(QWidget):
             config_file = Path("config/app_config.json")
             config_file.parent.mkdir(exist_ok=True)
             
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=4)
+            # Write a sibling temp file and rename it over the config, so a crash
+            # mid-write never leaves a truncated app_config.json behind
+            tmp_file = config_file.with_suffix(".json.tmp")
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(_dump_config(self.config))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, config_file)
+            except Exception:
+                tmp_file.unlink(missing_ok=True)
+                raise
             
             QMessageBox.information(self, "Framgång", "Inställningarna har sparats!")
             
@@ -255,15 +305,28 @@ class SettingsPanel(QWidget):
                 }
             }
             
-            # Update UI
-            self.base_dir_edit.setText(default_config["base_dir"])
-            self.integrated_dir_edit.setText(default_config["integrated_data_dir"])
-            self.theme_combo.setCurrentText(default_config["theme"])
-            self.font_size_spin.setValue(default_config["font_size"])
-            self.max_workers_spin.setValue(default_config["max_workers"])
-            self.tech_template_edit.setText(default_config["bot_settings"]["response_template_tech"])
-            self.compat_template_edit.setText(default_config["bot_settings"]["response_template_compat"])
-            self.summary_template_edit.setText(default_config["bot_settings"]["response_template_summary"])
+            # Update UI without the widgets' own signals; every setting is emitted below
+            widgets = (self.base_dir_edit, self.integrated_dir_edit, self.theme_combo,
+                       self.font_size_spin, self.max_workers_spin, self.tech_template_edit,
+                       self.compat_template_edit, self.summary_template_edit)
+            for widget in widgets:
+                widget.blockSignals(True)
+            try:
+                self.base_dir_edit.setText(default_config["base_dir"])
+                self.integrated_dir_edit.setText(default_config["integrated_data_dir"])
+                self.theme_combo.setCurrentText(default_config["theme"])
+                self.font_size_spin.setValue(default_config["font_size"])
+                self.max_workers_spin.setValue(default_config["max_workers"])
+                self.tech_template_edit.setText(default_config["bot_settings"]["response_template_tech"])
+                self.compat_template_edit.setText(default_config["bot_settings"]["response_template_compat"])
+                self.summary_template_edit.setText(default_config["bot_settings"]["response_template_summary"])
+            finally:
+                for widget in widgets:
+                    widget.blockSignals(False)
+            
+            # Drop debounced edits made before the reset
+            self._settings_timer.stop()
+            self._pending_settings.clear()
             
             # Update config
             self.config.update(default_config)
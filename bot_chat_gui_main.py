@@ -151,7 +151,7 @@ class MainWindow(QMainWindow):
         # Spara standardkonfiguration
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=4)
+                json.dump(config, f, ensure_ascii=False, indent=2)
         except Exception as e:
             logger.error(f"Kunde inte spara standardkonfiguration: {str(e)}")
         
@@ -195,6 +195,7 @@ class MainWindow(QMainWindow):
                 parent = parent[part]
             parent[parts[-1]] = value
         self.save_config()
+        self.product_explorer.reset_bot_engine()
         self.update_ui_from_settings()
         logger.info(f"Ändrade inställning: {setting_name} = {value}")
     
@@ -203,7 +204,7 @@ class MainWindow(QMainWindow):
         import json
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=4)
+                json.dump(self.config, f, ensure_ascii=False, indent=2)
         except Exception as e:
             logger.error(f"Kunde inte spara konfiguration: {str(e)}")
     
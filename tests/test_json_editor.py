@@ -0,0 +1,36 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "Bot"))
+
+from PySide6.QtWidgets import QApplication
+
+from modules.json_editor import JsonlPreview
+
+app = QApplication.instance() or QApplication([])
+
+
+def _entries(key, count):
+    return [f'{{"{key}": {i}, "n": {i}}}' for i in range(count)]
+
+
+def test_set_entries_after_scroll_keeps_lines_in_sync():
+    preview = JsonlPreview()
+    preview.resize(400, 300)
+    preview.show()
+    
+    preview.set_entries(_entries("a", 50))
+    scroll_bar = preview.verticalScrollBar()
+    scroll_bar.setValue(scroll_bar.maximum() // 2)
+    app.processEvents()
+    
+    preview.set_entries(_entries("b", 50))
+    app.processEvents()
+    assert preview._lines == preview.toPlainText().split('\n')
+    
+    preview.set_entries(['{"c": 3}'])
+    app.processEvents()
+    assert preview.toPlainText() == '{\n  "c": 3\n}'
+    assert preview._lines == preview.toPlainText().split('\n')